@@ -14,3 +14,9 @@ def test_weave_matrix_accepts_empty_and_mapping():
     WeaveMatrix({})
     # Should not raise for proper mapping even if incomplete
     WeaveMatrix({"t1": {}})
+
+
+def test_weave_matrix_accepts_tuples_but_checks_their_items():
+    WeaveMatrix({"t1": {"rargs": ("a",), "outputs": ("b",), "delta_time": 0.1}})
+    with pytest.raises(InvalidTaskCollectionError, match="must contain strings"):
+        WeaveMatrix({"t1": {"rargs": ("a", 1)}})
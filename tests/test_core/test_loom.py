@@ -1,10 +1,18 @@
+import functools
+import gc
+import sys
+import threading
+import weakref
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from weaveflow import Loom, reweave, weave
+from weaveflow import Loom, refine, reweave, weave
 from weaveflow._decorators import WeaveMeta
 from weaveflow._errors import InvalidLoomError
-from weaveflow._utils import _is_weave
+from weaveflow._utils import TaskProfiler, _is_weave
+from weaveflow.core import PandasWeave
 
 
 @weave(outputs="sum")
@@ -248,3 +256,1208 @@ def test_error_on_unknown_task_type(base_dataframe_input: pd.DataFrame):
 
     with pytest.raises(InvalidLoomError):
         Loom(database=base_dataframe_input, tasks=[unknown_task])
+
+
+def test_refine_sees_buffered_weave_outputs(
+    base_dataframe: pd.DataFrame, base_dataframe_input: pd.DataFrame
+):
+    """Tests that weave outputs are available to refine and later weave tasks."""
+
+    @refine
+    def keep_positive_scaled(df: pd.DataFrame):
+        return df[df["scaled_mul"] > 40]
+
+    loom = Loom(
+        database=base_dataframe_input,
+        tasks=[
+            add_columns,
+            subtract_columns,
+            calculate_stats,
+            scale_sum,
+            keep_positive_scaled,
+            margin_scaled,
+        ],
+    )
+    loom.run()
+
+    expected_df = base_dataframe[base_dataframe["scaled_mul"] > 40].copy()
+    expected_df["scaled_col1"] = expected_df["col1"]
+    pd.testing.assert_frame_equal(loom.database, expected_df)
+
+
+def test_extend_database_assigns_columns_in_place(base_dataframe_input: pd.DataFrame):
+    """Tests that extend_database adds and replaces columns on the Loom's copy."""
+    loom = Loom(database=base_dataframe_input, tasks=[add_columns])
+    loom.extend_database(outputs=["col1"], calculation_output=loom.database["col1"] * 10)
+    loom.extend_database(outputs=["a", "b"], calculation_output=(loom.database["col2"], 1))
+
+    assert list(loom.database.columns) == ["col1", "col2", "a", "b"]
+    assert loom.database["col1"].tolist() == [10, 20, 30]
+    assert loom.database["b"].tolist() == [1, 1, 1]
+    # The caller's DataFrame is left untouched
+    assert list(base_dataframe_input.columns) == ["col1", "col2"]
+    assert base_dataframe_input["col1"].tolist() == [1, 2, 3]
+
+
+def test_weave_task_resolution_is_cached(base_dataframe_input: pd.DataFrame):
+    """Tests that weave metadata is resolved once per task and Loom instance."""
+    calculate_stats_t = reweave(calculate_stats, meta={"col1": "diff", "col2": "sum"})
+    loom = Loom(database=base_dataframe_input, tasks=[calculate_stats_t])
+
+    plan = loom._resolve_weave_task(calculate_stats_t)
+    assert plan is loom._resolve_weave_task(calculate_stats_t)
+    assert plan[3] == ("col2", "col1")
+    assert plan[5] == ("mul", "div")
+
+
+def test_loom_options_do_not_swallow_task_optionals(base_dataframe_input: pd.DataFrame):
+    """Tests that optionals named like Loom options are rejected, not taken."""
+
+    @weave(outputs="out")
+    def shifted(col1: pd.Series, profile: int = 0):
+        return col1 + profile
+
+    # A global optional with an option's name is no longer silently used
+    with pytest.raises(InvalidLoomError, match="profile"):
+        Loom(base_dataframe_input, [shifted], profile=5)
+
+    # Such optionals reach the task via `optionals`
+    loom = Loom(base_dataframe_input, [shifted], optionals={"shifted": {"profile": 5}})
+    loom.run()
+    assert loom.database["out"].tolist() == [6, 7, 8]
+
+    # The options are keyword-only
+    with pytest.raises(TypeError):
+        Loom(
+            base_dataframe_input, [shifted], "default", None, False, None, None, None, True
+        )
+
+
+def test_memoize_reuses_outputs_for_identical_inputs(base_dataframe_input: pd.DataFrame):
+    """Tests that memoized weave tasks are only executed once per input."""
+    calls = []
+
+    @weave(outputs="total")
+    def count_total(col1: pd.Series, col2: pd.Series, offset: int = 0):
+        calls.append(1)
+        return col1 + col2 + offset
+
+    cache = {}
+    for _ in range(2):
+        loom = Loom(base_dataframe_input, [count_total], memoize=cache)
+        loom.run()
+        assert loom.database["total"].tolist() == [5, 7, 9]
+    assert len(calls) == 1
+    assert loom.weave_collector["default"]["count_total"]["delta_time"] == 0.0
+
+    # Changed optional arguments or inputs are not served from the cache
+    Loom(base_dataframe_input, [count_total], memoize=cache, offset=1).run()
+    Loom(base_dataframe_input * 2, [count_total], memoize=cache).run()
+    assert len(calls) == 3
+
+    # Memoization is off by default
+    Loom(base_dataframe_input, [count_total]).run()
+    assert len(calls) == 4
+
+
+def test_memoize_hashes_large_array_arguments_by_content():
+    """Tests that large array optionals differing in one element aren't mixed up."""
+
+    @weave(outputs="out")
+    def weighted(col1: pd.Series, w: np.ndarray = None):
+        return col1 * w[1000]
+
+    df = pd.DataFrame({"col1": [1.0, 2.0]})
+    w1 = np.ones(2000)
+    w2 = w1.copy()
+    w2[1000] = 2.0
+
+    cache = {}
+    first = Loom(df, [weighted], memoize=cache, w=w1)
+    first.run()
+    second = Loom(df, [weighted], memoize=cache, w=w2)
+    second.run()
+
+    assert first.database["out"].tolist() == [1.0, 2.0]
+    assert second.database["out"].tolist() == [2.0, 4.0]
+    # Same values with another dtype or shape are different inputs, too
+    assert PandasWeave._memo_key({}, {"w": w1}, {}) != PandasWeave._memo_key(
+        {}, {"w": w1.astype(np.float32)}, {}
+    )
+    assert PandasWeave._memo_key({}, {"w": w1}, {}) != PandasWeave._memo_key(
+        {}, {"w": w1.reshape(2, 1000)}, {}
+    )
+
+
+def test_memoize_keeps_tasks_with_the_same_name_apart():
+    """Tests that closures made by one factory never share memoized outputs."""
+
+    def make(factor: int):
+        @weave(outputs="scaled")
+        def scaled(col1: pd.Series):
+            return col1 * factor
+
+        return scaled
+
+    df = pd.DataFrame({"col1": [1, 2]})
+    cache = {}
+    for factor in (2, 3):
+        loom = Loom(df, [make(factor)], memoize=cache)
+        loom.run()
+        assert loom.database["scaled"].tolist() == [factor, 2 * factor]
+
+
+@pytest.mark.parametrize(
+    ("pipeline", "run_kwargs"),
+    [(PandasWeave, {}), (Loom, {}), (Loom, {"parallel": True})],
+    ids=["pandas_weave", "sequential", "parallel"],
+)
+def test_outputs_before_a_failing_task_reach_the_database(
+    base_dataframe_input: pd.DataFrame, pipeline: type, run_kwargs: dict
+):
+    """Tests that a failing weave task keeps the outputs of the tasks run before it."""
+
+    @weave(outputs="broken")
+    def broken(sum: pd.Series):
+        raise RuntimeError("task failed")
+
+    loom = pipeline(base_dataframe_input, [add_columns, broken])
+    with pytest.raises(RuntimeError, match="task failed"):
+        loom.run(**run_kwargs)
+
+    assert loom.database["sum"].tolist() == [5, 7, 9]
+    assert "broken" not in loom.database
+    assert loom._pending_cols == {}
+
+
+def test_parallel_run_matches_sequential_run(base_dataframe_input: pd.DataFrame):
+    """Tests that running independent weaves in parallel keeps the results."""
+
+    @refine
+    def drop_first(df: pd.DataFrame):
+        return df.iloc[1:]
+
+    tasks = [
+        add_columns,
+        subtract_columns,
+        calculate_stats,
+        margin_scaled,
+        scale_sum,
+        drop_first,
+        reweave(add_columns, meta={"sum": "sum_again"}),
+    ]
+    sequential = Loom(database=base_dataframe_input, tasks=tasks)
+    sequential.run()
+    parallel = Loom(database=base_dataframe_input, tasks=tasks)
+    parallel.run(parallel=True, max_workers=4)
+
+    pd.testing.assert_frame_equal(parallel.database, sequential.database)
+    assert list(parallel.weave_collector["default"]) == list(
+        sequential.weave_collector["default"]
+    )
+    # add_columns, subtract_columns and margin_scaled are independent
+    assert parallel._weave_layers(tasks[:5]) == [[0, 1, 3], [2], [4]]
+
+
+def test_jit_weave_receives_arrays(base_dataframe_input: pd.DataFrame):
+    """Tests that weaves with a compiler are compiled once and fed NumPy arrays."""
+    compiled = []
+
+    def fake_jit(f):
+        compiled.append(f.__name__)
+        return f
+
+    @weave(outputs="prod", jit=fake_jit)
+    def multiply(col1, col2):
+        assert isinstance(col1, np.ndarray)
+        assert isinstance(col2, np.ndarray)
+        return col1 * col2
+
+    assert multiply._weave_meta._array_input
+    assert not add_columns._weave_meta._array_input
+
+    loom = Loom(database=base_dataframe_input, tasks=[add_columns, multiply], memoize=True)
+    loom.run()
+
+    assert compiled == ["multiply"]
+    assert loom.database["prod"].tolist() == [4, 10, 18]
+    assert loom.database.index.equals(base_dataframe_input.index)
+
+
+def test_flush_keeps_latest_output_per_column(base_dataframe_input: pd.DataFrame):
+    """Tests that one flush appends each new column once with its latest values."""
+
+    @weave(outputs="col1")
+    def double_col1(col1: pd.Series):
+        return col1 * 2
+
+    tasks = [add_columns, reweave(subtract_columns, meta={"diff": "sum"}), double_col1]
+    loom = Loom(database=base_dataframe_input, tasks=tasks)
+    loom.run()
+
+    assert list(loom.database.columns) == ["col1", "col2", "sum"]
+    assert loom.database["sum"].tolist() == [3, 3, 3]
+    assert loom.database["col1"].tolist() == [2, 4, 6]
+    assert not loom._pending_cols
+
+
+def test_array_views_are_cached_until_column_changes(base_dataframe_input: pd.DataFrame):
+    """Tests that array-input weaves share NumPy views of unchanged columns."""
+    seen = []
+
+    @weave(outputs="prod", jit=lambda f: f)
+    def multiply(col1, col2):
+        seen.append(col1)
+        return col1 * col2
+
+    @weave(outputs="col1", jit=lambda f: f)
+    def shift_col1(col1):
+        seen.append(col1)
+        return col1 + 1
+
+    loom = Loom(
+        database=base_dataframe_input,
+        tasks=[multiply, reweave(multiply, meta={"prod": "prod2"}), shift_col1, multiply],
+    )
+    loom.run()
+
+    assert seen[0] is seen[1] is seen[2]
+    assert seen[3] is not seen[2]
+    assert seen[3].tolist() == [2, 3, 4]
+    assert loom.database["prod"].tolist() == [8, 15, 24]
+    assert not loom._ndarray_cache
+
+
+def test_series_inputs_are_shared_until_column_changes(
+    base_dataframe_input: pd.DataFrame,
+):
+    """Tests that weaves reading the same database column share one Series."""
+    seen = []
+
+    @weave(outputs="prod")
+    def multiply(col1, col2):
+        seen.append(col1)
+        return col1 * col2
+
+    @refine(inplace=True, touched_columns=["col1"])
+    def bump_col1(df: pd.DataFrame):
+        df["col1"] = df["col1"] + 1
+
+    loom = Loom(
+        database=base_dataframe_input.copy(),
+        tasks=[multiply, reweave(multiply, meta={"prod": "prod2"}), bump_col1, multiply],
+    )
+    loom.run()
+
+    assert seen[0] is seen[1]
+    assert seen[2] is not seen[1]
+    assert seen[2].tolist() == [2, 3, 4]
+    assert loom.database["prod"].tolist() == [8, 15, 24]
+    assert not loom._series_cache
+
+
+def test_profile_off_records_zero_time(base_dataframe_input: pd.DataFrame):
+    """Tests that task timing can be switched off."""
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    loom = Loom(base_dataframe_input, [add_columns, keep_all], profile=False)
+    loom.run()
+
+    assert loom.database["sum"].tolist() == [5, 7, 9]
+    assert loom.weave_collector["default"]["add_columns"]["delta_time"] == 0.0
+    assert loom.refine_collector["default"]["keep_all"]["delta_time"] == 0.0
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_loom_profile_false_never_reads_the_clock(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch, parallel: bool
+):
+    """Tests that no timer is read for weave or refine tasks without profiling."""
+
+    def clock():
+        raise AssertionError("timer read although profiling is off")
+
+    monkeypatch.setattr("weaveflow.core.loom.perf_counter_ns", clock)
+    monkeypatch.setattr("weaveflow._utils.profiler.perf_counter_ns", clock)
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    loom = Loom(base_dataframe_input, [add_columns, keep_all], profile=False)
+    loom.run(parallel=parallel)
+
+    assert loom.database["sum"].tolist() == [5, 7, 9]
+
+
+def test_specialized_dumpers_match_dump_to_frame(base_dataframe_input: pd.DataFrame):
+    """Tests that the per-output dumpers split outputs like dump_to_frame."""
+    index = base_dataframe_input.index
+    col1, col2 = base_dataframe_input["col1"], base_dataframe_input["col2"]
+    for outputs, output in [
+        (["a"], col1),
+        (["a"], 1),
+        (["a", "b"], (col1, col2.to_numpy())),
+        (["a", "b"], base_dataframe_input),
+    ]:
+        columns = Loom._make_dumper(outputs)(output, index)
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(dict(columns), index=index),
+            Loom.dump_to_frame(outputs, output, index=index, columns=outputs),
+        )
+
+    loom = Loom(base_dataframe_input, [add_columns, reweave(add_columns, {"sum": "s2"})])
+    loom.run()
+    assert set(loom._dumpers) == {("sum",), ("s2",)}
+
+
+def test_missing_inputs_are_reported_before_running(base_dataframe_input: pd.DataFrame):
+    """Tests that all missing columns are reported before any weave runs."""
+    calls = []
+
+    @weave(outputs="first")
+    def first(col1: pd.Series):
+        calls.append(1)
+        return col1
+
+    @weave(outputs="second")
+    def second(first: pd.Series, unknown_a: pd.Series, unknown_b: pd.Series):
+        return first
+
+    loom = Loom(database=base_dataframe_input, tasks=[first, second])
+    with pytest.raises(KeyError, match=r"\['unknown_a', 'unknown_b'\]"):
+        loom.run()
+    assert not calls
+
+    @refine
+    def drop_col1(df: pd.DataFrame):
+        return df.drop(columns="col1")
+
+    # Columns dropped by a refine task are caught when the weave runs
+    loom = Loom(database=base_dataframe_input, tasks=[first, drop_col1, first])
+    with pytest.raises(KeyError, match=r"\['col1'\]"):
+        loom.run()
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_weaves_after_refine_are_validated_before_they_run(
+    base_dataframe_input: pd.DataFrame, parallel: bool
+):
+    """Tests that each weave segment after a refine task is checked as a whole."""
+    calls = []
+
+    @weave(outputs="first")
+    def first(col2: pd.Series):
+        calls.append("first")
+        return col2
+
+    @weave(outputs="second")
+    def second(first: pd.Series, col1: pd.Series):
+        calls.append("second")
+        return first
+
+    @refine
+    def drop_col1(df: pd.DataFrame):
+        return df.drop(columns="col1")
+
+    loom = Loom(database=base_dataframe_input, tasks=[drop_col1, first, second])
+    with pytest.raises(KeyError, match=r"\['col1'\]"):
+        loom.run(parallel=parallel)
+    assert not calls
+
+
+def test_array_inputs_are_contiguous_and_dtype_backend(base_dataframe_input: pd.DataFrame):
+    """Tests contiguous array inputs and the optional dtype backend conversion."""
+    flags = []
+
+    @weave(outputs="prod", jit=lambda f: f)
+    def multiply(col1, col2):
+        flags.append(col1.flags["C_CONTIGUOUS"] and col2.flags["C_CONTIGUOUS"])
+        return col1 * col2
+
+    # Columns of a single 2D block are strided views of that block
+    block = pd.DataFrame(np.arange(6).reshape(3, 2), columns=["col1", "col2"])
+    Loom(block, [multiply]).run()
+
+    loom = Loom(base_dataframe_input, [multiply], dtype_backend="numpy_nullable")
+    loom.run()
+
+    assert flags == [True, True]
+    assert str(loom.database["col1"].dtype) == "Int64"
+    assert loom.database["prod"].tolist() == [4, 10, 18]
+
+
+def test_resolve_effective_names_without_mapping():
+    """Tests that names are returned as they are, without copies, without a mapping."""
+    meta = calculate_stats._weave_meta
+    rargs, oargs, outs = ["sum", "diff"], ["margin"], ["mul", "div"]
+    name_map, rargs_m, oargs_m, outs_m = Loom._resolve_effective_names(
+        meta, rargs, oargs, outs
+    )
+    assert name_map == {}
+    assert (rargs_m, oargs_m, outs_m) == (rargs, oargs, outs)
+    assert rargs_m is rargs
+    assert oargs_m is oargs
+    assert outs_m is outs
+
+
+def test_inplace_refine_keeps_database_and_untouched_views(
+    base_dataframe_input: pd.DataFrame,
+):
+    """Tests that in-place refines keep the database object and unrelated caches."""
+
+    @refine(inplace=True, touched_columns="col1")
+    def negate_col1(df: pd.DataFrame):
+        df["col1"] = -df["col1"]
+
+    @weave(outputs="prod", jit=lambda f: f)
+    def multiply(col1, col2):
+        return col1 * col2
+
+    loom = Loom(base_dataframe_input, [multiply, negate_col1])
+    database = loom.database
+    loom._col_array("col1")
+    loom._col_array("col2")
+    loom._run_refine_task(negate_col1)
+
+    assert loom.database is database
+    assert set(loom._ndarray_cache) == {"col2"}
+    assert loom.database["col1"].tolist() == [-1, -2, -3]
+    assert loom.refine_collector["default"]["negate_col1"]["rows_reduced"] == 0
+    assert negate_col1._refine_meta._touched_cols == ["col1"]
+    assert base_dataframe_input["col1"].tolist() == [1, 2, 3]
+
+
+def test_disjoint_inplace_refines_run_concurrently(base_dataframe_input: pd.DataFrame):
+    """Tests grouping and parallel execution of disjoint in-place refines."""
+
+    @refine(inplace=True, touched_columns="col1")
+    def negate_col1(df: pd.DataFrame):
+        df["col1"] = -df["col1"]
+
+    @refine(inplace=True, touched_columns=["col2", "extra"])
+    def scale_col2(df: pd.DataFrame):
+        df["col2"] = df["col2"] * 10
+        df["extra"] = 1
+
+    @refine(inplace=True, touched_columns="col1")
+    def shift_col1(df: pd.DataFrame):
+        df["col1"] = df["col1"] + 1
+
+    @refine
+    def drop_first(df: pd.DataFrame):
+        return df.iloc[1:]
+
+    refines = [negate_col1, scale_col2, shift_col1, drop_first, negate_col1]
+    assert Loom._refine_groups(refines) == [
+        [negate_col1, scale_col2],
+        [shift_col1],
+        [drop_first],
+        [negate_col1],
+    ]
+
+    tasks = [add_columns, *refines, subtract_columns]
+    sequential = Loom(base_dataframe_input, tasks)
+    sequential.run()
+    parallel = Loom(base_dataframe_input, tasks)
+    parallel.run(parallel=True)
+
+    pd.testing.assert_frame_equal(parallel.database, sequential.database)
+    assert list(parallel.refine_collector["default"]) == list(
+        sequential.refine_collector["default"]
+    )
+    assert parallel.database["col1"].tolist() == [1, 2]
+    assert base_dataframe_input["col2"].tolist() == [4, 5, 6]
+
+
+def test_collect_optionals_for_task(base_dataframe_input: pd.DataFrame):
+    """Tests global and task-specific optionals, looked up by name or task."""
+    loom = Loom(
+        base_dataframe_input,
+        [add_columns, margin_scaled],
+        optionals={margin_scaled: {"margin": 5}},
+        scaler=3,
+    )
+    assert loom._collect_optionals_for_task("add_columns", [], add_columns) == {}
+    assert loom._collect_optionals_for_task(
+        "margin_scaled", ["scaler", "margin"], margin_scaled
+    ) == {"scaler": 3, "margin": 5}
+
+    loom.optionals = {"add_columns": {"unused": 1}}
+    assert loom._collect_optionals_for_task("add_columns", [], add_columns) == {
+        "unused": 1
+    }
+
+    plain = Loom(base_dataframe_input, [margin_scaled])
+    assert (
+        plain._collect_optionals_for_task(
+            "margin_scaled", ["scaler", "margin"], margin_scaled
+        )
+        == {}
+    )
+
+
+@pytest.mark.parametrize(("lazy_concat", "n_concats"), [(True, 2), (False, 0)])
+def test_weave_outputs_are_concatenated_once_per_segment(
+    base_dataframe_input: pd.DataFrame,
+    monkeypatch: pytest.MonkeyPatch,
+    lazy_concat: bool,
+    n_concats: int,
+):
+    """Tests that the database is extended by one concat per refine-free segment.
+
+    Without Copy-on-Write, the new columns are inserted without any concat.
+    """
+    concat_calls = []
+    concat = pd.concat
+
+    def counting_concat(*args, **kwargs):
+        concat_calls.append(1)
+        return concat(*args, **kwargs)
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    tasks = [add_columns, subtract_columns, calculate_stats, keep_all, scale_sum]
+    loom = Loom(database=base_dataframe_input, tasks=tasks)
+    monkeypatch.setattr(pd, "concat", counting_concat)
+    monkeypatch.setattr("weaveflow.core.loom._concat_is_lazy", lambda: lazy_concat)
+    loom.run()
+
+    assert len(concat_calls) == n_concats
+    assert list(loom.database.columns) == [
+        "col1",
+        "col2",
+        "sum",
+        "diff",
+        "mul",
+        "div",
+        "scaled_mul",
+    ]
+
+
+def test_dataframe_outputs_are_aligned_before_later_weaves_read_them():
+    """Tests that buffered DataFrame outputs match what the flush keeps."""
+
+    @weave(outputs="a")
+    def unaligned(col1: pd.Series):
+        return pd.DataFrame({"a": [10, 20]})
+
+    @weave(outputs="c", raw=True)
+    def doubled(a):
+        return a * 2
+
+    df = pd.DataFrame({"col1": [1, 2]}, index=[5, 6])
+    loom = Loom(df, [unaligned, doubled])
+    loom.run()
+
+    assert loom.database["a"].isna().all()
+    assert loom.database["c"].isna().all()
+
+
+def test_engine_compiles_each_weave_once_per_loom(base_dataframe_input: pd.DataFrame):
+    """Tests that a Loom engine compiles the undecorated weave functions once."""
+    compiled = []
+
+    def fake_engine(f):
+        compiled.append(f)
+
+        def run(**kwargs):
+            assert all(isinstance(v, np.ndarray) for v in kwargs.values())
+            return f(**kwargs)
+
+        return run
+
+    tasks = [add_columns, reweave(add_columns, meta={"sum": "sum2"})]
+    loom = Loom(base_dataframe_input, tasks, engine=fake_engine)
+    loom.run()
+    loom._run()
+
+    assert len(compiled) == 2
+    assert not any(hasattr(f, "__wrapped__") for f in compiled)
+    assert loom.database["sum2"].tolist() == [5, 7, 9]
+
+
+def test_engine_compiles_raw_tasks_and_keeps_user_decorators(
+    base_dataframe_input: pd.DataFrame,
+):
+    """Tests that the engine skips only jit tasks and keeps user decorators."""
+    compiled = []
+
+    def fake_engine(f):
+        compiled.append(f)
+        return f
+
+    def doubled(f):
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            return f(*args, **kwargs) * 2
+
+        return wrapper
+
+    @weave(outputs="raw_sum", raw=True)
+    def raw_sum(col1, col2):
+        return col1 + col2
+
+    @weave(outputs="double_sum")
+    @doubled
+    def double_sum(col1, col2):
+        return col1 + col2
+
+    @weave(outputs="jit_sum", jit=lambda f: f)
+    def jit_sum(col1, col2):
+        return col1 + col2
+
+    loom = Loom(base_dataframe_input, [raw_sum, double_sum, jit_sum], engine=fake_engine)
+    loom.run()
+
+    assert [f.__name__ for f in compiled] == ["raw_sum", "double_sum"]
+    # The user decorator is compiled along with the function, not stripped
+    assert compiled[1].__wrapped__.__name__ == "double_sum"
+    assert loom.database["double_sum"].tolist() == [10, 14, 18]
+
+
+def test_engine_skips_tasks_declared_with_raw_false(base_dataframe_input: pd.DataFrame):
+    """Tests that tasks declared with raw=False keep receiving Series with an engine."""
+    compiled = []
+
+    def fake_engine(f):
+        compiled.append(f.__name__)
+        return f
+
+    @weave(outputs="labels", raw=False)
+    def labels(col1):
+        return col1.astype(str).str.zfill(2)
+
+    loom = Loom(base_dataframe_input, [labels], engine=fake_engine)
+    loom.run()
+
+    assert compiled == []
+    assert loom.database["labels"].tolist() == ["01", "02", "03"]
+
+
+def test_task_plans_of_temporary_tasks_never_collide(base_dataframe_input: pd.DataFrame):
+    """Tests that plans of short-lived reweaved tasks are never mixed up."""
+    loom = Loom(database=base_dataframe_input, tasks=[add_columns])
+    for i in range(20):
+        plan = loom._resolve_weave_task(reweave(add_columns, meta={"sum": f"sum_{i}"}))
+        assert plan[5] == (f"sum_{i}",)
+
+
+def test_raw_weave_receives_arrays(base_dataframe_input: pd.DataFrame):
+    """Tests that raw weaves get NumPy arrays without being compiled."""
+
+    @weave(outputs="ratio", raw=True)
+    def ratio(col1, col2):
+        assert type(col1) is np.ndarray
+        return col1 / col2
+
+    assert ratio._weave_meta._array_input
+    loom = Loom(database=base_dataframe_input, tasks=[ratio])
+    loom.run()
+    assert loom.database["ratio"].tolist() == [0.25, 0.4, 0.5]
+
+
+@pytest.mark.parametrize("options", [{"jit": lambda f: f}, {"out": True}])
+def test_raw_false_cannot_be_combined_with_array_options(options: dict):
+    """Tests that an explicit raw=False is not silently overridden by jit or out."""
+    with pytest.raises(ValueError, match="'raw' cannot be False"):
+
+        @weave(outputs="ratio", raw=False, **options)
+        def ratio(col1, col2, out=None):
+            return col1 / col2
+
+
+def test_weave_out_none_leaves_preallocation_off(base_dataframe_input: pd.DataFrame):
+    """Tests that out=None behaves like out=False, without array inputs or buffers."""
+
+    @weave(outputs="total", out=None)
+    def total(col1, col2, out=1):
+        assert isinstance(col1, pd.Series)
+        return col1 + col2 + out
+
+    meta = total._weave_meta
+    assert meta._array_input is None
+    assert meta._out_dtype is None
+    assert meta._oargs == ["out"]
+
+    loom = Loom(base_dataframe_input, [total])
+    loom.run()
+    assert loom.database["total"].tolist() == [6, 8, 10]
+
+
+def test_weave_execution_options_are_keyword_only():
+    """Tests that jit, raw and out can't be passed positionally."""
+    with pytest.raises(TypeError):
+        weave("total", None, None, True)
+
+
+def test_weave_meta_follows_the_loom_by_default():
+    """Tests that WeaveMeta leaves the input type to the Loom unless set."""
+    meta = WeaveMeta(_weave=True, _rargs=[], _oargs=[], _outputs=["x"], _params={})
+    assert meta._array_input is None
+
+
+def test_weaves_are_timed_without_task_profiler(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that only refine tasks are run through a TaskProfiler."""
+    profiled = []
+
+    def counting_profiler(task, *args, **kwargs):
+        profiled.append(task.__name__)
+        return TaskProfiler(task, *args, **kwargs)
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    monkeypatch.setattr("weaveflow.core.loom.TaskProfiler", counting_profiler)
+    loom = Loom(base_dataframe_input, [add_columns, keep_all, subtract_columns])
+    loom.run()
+
+    assert profiled == ["keep_all"]
+    records = loom.weave_collector["default"]
+    assert all(
+        records[name]["delta_time"] > 0 for name in ("add_columns", "subtract_columns")
+    )
+
+
+def test_array_weaves_chain_outputs_without_round_trip(base_dataframe_input: pd.DataFrame):
+    """Tests that array outputs reach later array-input weaves as the same arrays."""
+    produced = {}
+
+    @weave(outputs="total", raw=True)
+    def total(col1, col2):
+        produced["total"] = col1 + col2
+        return produced["total"]
+
+    @weave(outputs=["double", "half"], raw=True)
+    def scaled(total):
+        assert total is produced["total"]
+        return total * 2, total / 2
+
+    @weave(outputs="quarter", raw=True)
+    def quarter(half):
+        return half / 2
+
+    loom = Loom(base_dataframe_input, [total, scaled, quarter])
+    loom.run()
+
+    assert loom.database["double"].tolist() == [10, 14, 18]
+    assert loom.database["quarter"].tolist() == [1.25, 1.75, 2.25]
+    assert not loom._ndarray_cache
+
+
+def test_out_weaves_write_into_preallocated_arrays(base_dataframe_input: pd.DataFrame):
+    """Tests that out weaves fill arrays allocated by the Loom."""
+
+    @weave(outputs="total", out=True)
+    def total(col1, col2, out):
+        assert out.flags.c_contiguous
+        assert out.dtype == np.float64
+        np.add(col1, col2, out=out)
+
+    @weave(outputs=["double", "square"], out="int64")
+    def powers(col1, out):
+        np.multiply(col1, 2, out=out[0])
+        np.multiply(col1, col1, out=out[1])
+
+    assert total._weave_meta._rargs == ["col1", "col2"]
+    loom = Loom(base_dataframe_input, [total, powers])
+    loom.run()
+
+    assert loom.database["total"].tolist() == [5.0, 7.0, 9.0]
+    assert str(loom.database["square"].dtype) == "int64"
+    assert loom.database["double"].tolist() == [2, 4, 6]
+    assert loom.database["square"].tolist() == [1, 4, 9]
+
+
+def test_task_types_and_segments_are_resolved_once(base_dataframe_input: pd.DataFrame):
+    """Tests that the Loom groups its tasks into weave and refine segments up front."""
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    tasks = [add_columns, subtract_columns, keep_all, keep_all, calculate_stats]
+    loom = Loom(database=base_dataframe_input, tasks=tasks)
+
+    assert [is_weave for _, is_weave in loom._dispatch] == [True, True, False, False, True]
+    assert loom._segments == [
+        (True, [add_columns, subtract_columns]),
+        (False, [keep_all, keep_all]),
+        (True, [calculate_stats]),
+    ]
+
+
+def test_parallel_run_executes_engine_tasks_concurrently(
+    base_dataframe_input: pd.DataFrame,
+):
+    """Tests that independent compiled weaves run at the same time in a parallel run."""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def waiting_engine(f):
+        def run(**kwargs):
+            # Only passes if both independent tasks are running at once
+            barrier.wait()
+            return f(**kwargs)
+
+        return run
+
+    loom = Loom(
+        base_dataframe_input, [add_columns, subtract_columns], engine=waiting_engine
+    )
+    loom.run(parallel=True)
+
+    assert loom.database["sum"].tolist() == [5, 7, 9]
+    assert loom.database["diff"].tolist() == [3, 3, 3]
+
+
+def test_collectors_are_plain_dicts_with_a_bucket(base_dataframe_input: pd.DataFrame):
+    """Tests that the collectors hold exactly one bucket for the pipeline name."""
+    loom = Loom(base_dataframe_input, [add_columns], weaveflow_name="stats")
+
+    assert type(loom.weave_collector) is dict
+    assert type(loom.refine_collector) is dict
+    assert loom.weave_collector == {"stats": {}}
+    assert loom.refine_collector == {"stats": {}}
+    loom.run()
+    assert loom._weave_records is loom.weave_collector["stats"]
+    assert list(loom.weave_collector["stats"]) == ["add_columns"]
+
+
+def test_refine_runs_are_recorded_into_the_bound_bucket(
+    base_dataframe_input: pd.DataFrame,
+):
+    """Tests that refine records go to the bucket resolved once at construction."""
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    loom = Loom(base_dataframe_input, [keep_all], weaveflow_name="stats")
+    bucket = loom._refine_records
+    loom.run()
+    loom.run()
+
+    assert bucket is loom.refine_collector["stats"]
+    assert list(bucket) == ["keep_all"]
+
+
+def test_dump_to_frame_single_series(base_dataframe_input: pd.DataFrame):
+    """Tests that a single Series output is turned into a frame with its index."""
+    series = base_dataframe_input["col1"].rename("other")
+    series.index = ["a", "b", "c"]
+    frame = Loom.dump_to_frame(["out"], series)
+
+    pd.testing.assert_frame_equal(frame, pd.DataFrame({"out": series}))
+    assert list(Loom.dump_to_frame(["out"], series, index=["b"])["out"]) == [2]
+
+
+def test_column_set_is_cached_until_columns_change(base_dataframe_input: pd.DataFrame):
+    """Tests that the set of database columns is rebuilt only for new columns."""
+    loom = Loom(base_dataframe_input, [add_columns])
+    columns = loom._column_set()
+
+    assert columns == {"col1", "col2"}
+    assert loom._column_set() is columns
+    loom.run()
+    assert loom._column_set() == {"col1", "col2", "sum"}
+    loom.database = loom.database.drop(columns="col2")
+    assert loom._column_set() == {"col1", "sum"}
+
+
+def test_weave_records_share_the_planned_names(base_dataframe_input: pd.DataFrame):
+    """Tests that records of repeated runs reuse the name tuples of the task plan."""
+    loom = Loom(base_dataframe_input, [add_columns])
+    loom.run()
+    first = loom.weave_collector["default"]["add_columns"]
+    loom._run()
+    second = loom.weave_collector["default"]["add_columns"]
+
+    assert first is not second
+    assert list(loom.weave_collector["default"]) == ["add_columns"]
+    assert second["rargs"] == ("col1", "col2")
+    assert second["rargs"] is first["rargs"]
+    assert second["outputs"] is first["outputs"]
+
+
+def test_refine_returning_none_keeps_the_database(base_dataframe_input: pd.DataFrame):
+    """Tests that a refine task mutating its frame and returning None is in-place."""
+
+    seen = []
+
+    @refine
+    def scale_col1(df: pd.DataFrame):
+        seen.append(df)
+        df["col1"] = df["col1"] * 10
+
+    loom = Loom(base_dataframe_input, [add_columns, scale_col1, add_columns])
+    loom.run()
+
+    assert loom.database is seen[0]
+    assert loom.database["sum"].tolist() == [14, 25, 36]
+
+
+def test_refined_away_frames_are_released_immediately(base_dataframe_input: pd.DataFrame):
+    """Tests that the Loom keeps no reference to a frame replaced by a refine task."""
+    refs, alive = [], []
+
+    @refine
+    def shrink(df: pd.DataFrame):
+        refs.append(weakref.ref(df))
+        return df[df["col1"] > 1]
+
+    @refine
+    def check(df: pd.DataFrame):
+        alive.append(refs[0]() is not None)
+        return df
+
+    loom = Loom(base_dataframe_input, [add_columns, shrink, check])
+    # Without the cycle collector, frames are only freed by reference counting
+    gc.disable()
+    try:
+        loom.run()
+    finally:
+        gc.enable()
+
+    assert alive == [False]
+    assert loom.database["sum"].tolist() == [7, 9]
+
+
+def test_pandas_weave_run_extends_the_database_once(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that a plain PandasWeave run adds all outputs in a single step."""
+    concat_calls = []
+    concat = pd.concat
+
+    def counting_concat(*args, **kwargs):
+        concat_calls.append(1)
+        return concat(*args, **kwargs)
+
+    weave_run = PandasWeave(
+        base_dataframe_input, [add_columns, subtract_columns, calculate_stats]
+    )
+    monkeypatch.setattr(pd, "concat", counting_concat)
+    weave_run.run()
+
+    assert len(concat_calls) <= 1
+    assert list(weave_run.database.columns) == [
+        "col1",
+        "col2",
+        "sum",
+        "diff",
+        "mul",
+        "div",
+    ]
+    assert weave_run.database["mul"].tolist() == [15, 21, 27]
+
+
+def test_reweaved_inputs_are_read_without_copying(base_dataframe_input: pd.DataFrame):
+    """Tests that mapped inputs are the database columns, not copies of the frame."""
+    seen = {}
+
+    @weave(outputs="total")
+    def total(a: pd.Series, b: pd.Series):
+        seen["a"], seen["b"] = a, b
+        return a + b
+
+    loom = Loom(base_dataframe_input, [reweave(total, meta={"a": "col1", "b": "col2"})])
+    database = loom.database
+    loom.run()
+
+    assert np.shares_memory(seen["a"].to_numpy(), database["col1"].to_numpy())
+    assert np.shares_memory(seen["b"].to_numpy(), database["col2"].to_numpy())
+    assert loom.database["total"].tolist() == [5, 7, 9]
+
+
+def test_loom_accepts_a_generator_of_tasks(base_dataframe_input: pd.DataFrame):
+    """Tests that tasks given as a one-shot iterable are all run."""
+    loom = Loom(base_dataframe_input, (task for task in [add_columns, subtract_columns]))
+    loom.run()
+
+    assert loom.weave_tasks == [add_columns, subtract_columns]
+    assert loom.database["diff"].tolist() == [3, 3, 3]
+
+
+def test_extend_database_builds_no_intermediate_frame(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that outputs are assigned as columns without wrapping them in a frame."""
+    loom = Loom(database=base_dataframe_input, tasks=[add_columns])
+    series, array = loom.database["col1"] * 2, np.array([7, 8, 9])
+    frames = []
+    init = pd.DataFrame.__init__
+
+    def counting_init(self, *args, **kwargs):
+        frames.append(1)
+        init(self, *args, **kwargs)
+
+    monkeypatch.setattr(pd.DataFrame, "__init__", counting_init)
+    loom.extend_database(["double"], series)
+    loom.extend_database(["x", "y"], (array, series))
+
+    assert not frames
+    assert loom.database["x"].tolist() == [7, 8, 9]
+    assert loom.database["y"].tolist() == [2, 4, 6]
+
+
+def test_raw_loom_passes_arrays_unless_a_task_opts_out(base_dataframe_input: pd.DataFrame):
+    """Tests that Loom(raw=True) passes arrays to tasks without an own choice."""
+    kinds = {}
+
+    @weave(outputs="total")
+    def total(col1, col2):
+        kinds["total"] = type(col1)
+        return col1 + col2
+
+    @weave(outputs="labels", raw=False)
+    def labels(col1):
+        kinds["labels"] = type(col1)
+        return col1.astype(str).str.zfill(2)
+
+    loom = Loom(base_dataframe_input, [total, labels], raw=True)
+    loom.run()
+
+    assert kinds == {"total": np.ndarray, "labels": pd.Series}
+    assert loom.database["total"].tolist() == [5, 7, 9]
+    assert loom.database["labels"].tolist() == ["01", "02", "03"]
+
+    Loom(base_dataframe_input, [total]).run()
+    assert kinds["total"] is pd.Series
+
+
+def test_weave_layers_are_built_once_per_segment(base_dataframe_input: pd.DataFrame):
+    """Tests that repeated parallel runs reuse the layers of each weave segment."""
+
+    @refine
+    def keep_all(df: pd.DataFrame):
+        return df
+
+    tasks = [add_columns, subtract_columns, calculate_stats, keep_all, scale_sum]
+    loom = Loom(base_dataframe_input, tasks)
+    loom.run(parallel=True)
+    layers = dict(loom._segment_layers)
+    loom._run_parallel()
+
+    assert layers == {0: [[0, 1], [2]], 2: [[0]]}
+    assert all(loom._segment_layers[i] is layers[i] for i in layers)
+
+
+def test_jit_true_falls_back_without_numba(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that jit=True runs the task uncompiled on arrays if numba is missing."""
+    monkeypatch.setitem(sys.modules, "numba", None)
+
+    with pytest.warns(RuntimeWarning, match="numba is not installed"):
+
+        @weave(outputs="total", jit=True)
+        def total(col1, col2):
+            assert type(col1) is np.ndarray
+            return col1 + col2
+
+    assert total._weave_meta._array_input
+    loom = Loom(base_dataframe_input, [total])
+    loom.run()
+    assert loom.database["total"].tolist() == [5, 7, 9]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_skipped_weave_is_never_recorded(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch, parallel: bool
+):
+    """Tests that a weave returning None is not written to the collector at all."""
+
+    @weave(outputs="nothing")
+    def nothing(col1):
+        return None
+
+    @weave(outputs="total")
+    def total(col1, col2):
+        return col1 + col2
+
+    recorded = []
+    record = PandasWeave._record_weave_run
+
+    def spy(self, weave_name, **kwargs):
+        recorded.append(weave_name)
+        record(self, weave_name, **kwargs)
+
+    monkeypatch.setattr(PandasWeave, "_record_weave_run", spy)
+    loom = Loom(base_dataframe_input, [nothing, total])
+    loom.run(parallel=parallel)
+
+    assert recorded == ["total"]
+    assert list(loom.weave_collector[loom.weaveflow_name]) == ["total"]
+    assert "nothing" not in loom.database
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_skipped_weave_drops_the_record_of_an_earlier_run(
+    base_dataframe_input: pd.DataFrame, parallel: bool
+):
+    """Tests that a weave returning None no longer shows outputs of an earlier run."""
+    skip = []
+
+    @weave(outputs="total")
+    def total(col1, col2):
+        return None if skip else col1 + col2
+
+    loom = Loom(base_dataframe_input, [total])
+    loom.run(parallel=parallel)
+    assert "total" in loom.weave_collector[loom.weaveflow_name]
+
+    skip.append(True)
+    loom.run(parallel=parallel)
+    assert "total" not in loom.weave_collector[loom.weaveflow_name]
+
+
+def test_task_names_are_resolved_once_across_looms(
+    base_dataframe_input: pd.DataFrame, monkeypatch: pytest.MonkeyPatch
+):
+    """Tests that looms built per batch share the resolved names of their tasks."""
+
+    @weave(outputs="total")
+    def total(col1, col2):
+        return col1 + col2
+
+    remapped = reweave(total, meta={"col2": "total", "total": "total2"})
+    calls = []
+    resolve = PandasWeave._resolve_effective_names
+
+    def spy(*args):
+        calls.append(args[0])
+        return resolve(*args)
+
+    monkeypatch.setattr(PandasWeave, "_resolve_effective_names", staticmethod(spy))
+    for _ in range(3):
+        loom = Loom(base_dataframe_input, [total, remapped])
+        loom.run()
+
+    assert len(calls) == 2
+    assert loom.database["total"].tolist() == [5, 7, 9]
+    assert loom.database["total2"].tolist() == [6, 9, 12]
+
+
+def test_task_names_cache_does_not_keep_tasks_alive(base_dataframe_input: pd.DataFrame):
+    """Tests that a task dropped by the caller is not kept alive by the names cache."""
+
+    @weave(outputs="total")
+    def total(col1, col2):
+        return col1 + col2
+
+    # Column inference does not keep the task alive either
+    Loom(base_dataframe_input, [total], infer_weave_columns=True).run()
+    task_ref = weakref.ref(total)
+    del total
+    gc.collect()
+
+    assert task_ref() is None
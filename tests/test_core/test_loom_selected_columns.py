@@ -10,6 +10,7 @@ import pytest
 from pandas import DataFrame
 
 from weaveflow import Loom, refine, weave
+from weaveflow._errors import InvalidLoomError
 
 
 @weave(outputs="z1")
@@ -102,6 +103,27 @@ def test_loom_columns_infer_refine(personal_data):
     ]
 
 
+def test_loom_columns_infer_declared_refine_reads(personal_data):
+    """Tests that inferred columns include the declared inputs of refine tasks."""
+
+    @refine(read_columns=["age", "satisfaction_score_per_income"])
+    def filter_age(df: DataFrame) -> DataFrame:
+        return df[df["age"] > 30]
+
+    loom = Loom(
+        personal_data,
+        [get_income_per_person, get_satisfaction_score_per_income, filter_age],
+        infer_weave_columns=True,
+    )
+    # Declared columns produced by weave tasks are not required up front
+    needed = {"age", "children", "income_thousands", "satisfaction_score"}
+    assert loom.database.columns.tolist() == [
+        c for c in personal_data.columns if c in needed
+    ]
+    loom.run()
+    assert all(loom.database["age"] > 30)
+
+
 def test_loom_columns_unknown_column_error(personal_data):
     """Tests that Loom correctly raises error on unknown column."""
     with pytest.raises(
@@ -114,3 +136,30 @@ def test_loom_columns_unknown_column_error(personal_data):
             infer_weave_columns=True,
             refine_columns=["unknown_columns"],
         )
+
+
+def test_loom_columns_mixed_selection_keeps_frame_order(personal_data):
+    """Tests that a string refine column combines with inferred weave columns."""
+    loom = Loom(
+        personal_data,
+        [filter_data, get_income_per_person, get_satisfaction_score_per_income],
+        infer_weave_columns=True,
+        refine_columns="age",
+    )
+    needed = {"children", "income_thousands", "satisfaction_score"}
+    inferred = [c for c in personal_data.columns if c in needed]
+    assert loom.database.columns.tolist() == ["age", *inferred]
+
+
+def test_loom_columns_inference_rejects_invalid_tasks(personal_data):
+    """Tests that an invalid task is rejected by the validator when inferring columns."""
+
+    def plain_function(df):
+        return df
+
+    with pytest.raises(InvalidLoomError):
+        Loom(
+            personal_data,
+            [plain_function, get_income_per_person],
+            infer_weave_columns=True,
+        )
@@ -84,3 +84,21 @@ def test_spool_weave(finacial_dataframe):
     pd.testing.assert_frame_equal(
         loom.database[["net_worth", "status"]], df[["net_worth", "status"]]
     )
+
+
+def test_spool_weave_records_share_param_names(finacial_dataframe):
+    """Tests that the recorded parameter names are reused across runs and looms."""
+    records = []
+    for _ in range(2):
+        loom = Loom(finacial_dataframe, [how_rich_are_you])
+        loom.run()
+        records.append(loom.weave_collector[loom.weaveflow_name]["how_rich_are_you"])
+
+    assert records[0]["params"] == (
+        "taxation",
+        "threshold_low",
+        "threshold_middle",
+        "threshold_high",
+        "threshold_very_high",
+    )
+    assert records[0]["params"] is records[1]["params"]
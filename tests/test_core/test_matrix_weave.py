@@ -236,3 +236,54 @@ def test_build_matrix_only_refines_results_empty():
     matrix_df = WeaveGraph(loom).build_matrix()
 
     assert_frame_equal(matrix_df, pd.DataFrame())
+
+
+def test_weave_matrix_labels_share_interned_objects():
+    task_collection = {
+        f"t{i}": {
+            "rargs": ["a", "b"],
+            "oargs": ["c"],
+            "outputs": [f"y{i}", "a"],
+            "params": [],
+        }
+        for i in range(5)
+    }
+    df = WeaveMatrix(task_collection).build()
+
+    # At most six distinct label objects back the whole matrix
+    assert len({id(v) for v in df.to_numpy().ravel()}) <= 6
+
+
+def test_weave_matrix_unsorted_keeps_first_seen_order():
+    task_collection = {
+        "t2": {"rargs": ["z"], "oargs": [], "outputs": ["b"], "params": []},
+        "t1": {"rargs": ["b"], "oargs": ["a"], "outputs": ["c"], "params": []},
+    }
+    df = WeaveMatrix(task_collection).build(sort=False)
+
+    expected = pd.DataFrame(
+        {
+            "t2": ["required input", "Output", "", ""],
+            "t1": ["", "required input", "optional input", "Output"],
+        },
+        index=["z", "b", "a", "c"],
+    )
+    assert_frame_equal(df, expected)
+
+
+def test_weave_matrix_reflects_tasks_added_after_creation():
+    task_collection = {"t1": {"rargs": ["a"], "oargs": [], "outputs": ["b"], "params": []}}
+    matrix = WeaveMatrix(task_collection)
+    matrix.build()
+
+    task_collection["t2"] = {
+        "rargs": ["b"],
+        "oargs": ["c"],
+        "outputs": ["d"],
+        "params": [],
+    }
+    df = matrix.build()
+
+    assert df.loc["b", "t2"] == "required input"
+    assert df.loc["c", "t2"] == "optional input"
+    assert df.loc["d", "t2"] == "Output"
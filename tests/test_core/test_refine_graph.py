@@ -86,6 +86,44 @@ def test_refine_graph_data_profiler():
     assert 'label="&#9662; 5 rows"' in src or 'label="🔻 5 rows"' in src
 
 
+@refine
+def row_adding_refine_task(df: pd.DataFrame) -> pd.DataFrame:
+    """A refine task that duplicates all rows."""
+    return pd.concat([df, df])
+
+
+@pytest.mark.refinegraph
+@pytest.mark.profiler
+def test_refine_graph_data_profiler_added_rows():
+    """Test that added rows are labelled with an upward marker."""
+    df = pd.DataFrame({"a": range(10)})
+    loom = Loom(df, [row_adding_refine_task])
+    loom.run()
+
+    src = RefineGraph(loom).build(data_profiler=True, legend=False).source
+
+    # The task adds 10 rows (10 -> 20)
+    assert 'label="🔺 10 rows"' in src
+
+
+@pytest.mark.refinegraph
+@pytest.mark.profiler
+@pytest.mark.parametrize("profile", [True, False])
+def test_refine_graph_labels_skip_missing_profile_values(profile):
+    """Test that records without a time or row count are drawn without a label."""
+    df = pd.DataFrame({"a": range(10)})
+    loom = Loom(df, [row_dropping_refine_task], profile=profile)
+    loom.run()
+    record = loom.refine_collector[loom.weaveflow_name]["row_dropping_refine_task"]
+    del record["delta_time"], record["rows_reduced"]
+
+    src = RefineGraph(loom).build(timer=True, data_profiler=True, legend=False).source
+
+    edges = [line for line in src.splitlines() if "->" in line]
+    assert edges
+    assert not any("label=" in line for line in edges)
+
+
 @pytest.mark.refinegraph
 @pytest.mark.empty
 def test_refine_graph_empty_tasks():
@@ -126,3 +164,42 @@ def test_refine_graph_parameter_nodes():
     assert 'MyParams [fillcolor="#f08080"' in src
     assert 'a [fillcolor="#ffb6c1"' in src
     assert 'b [fillcolor="#ffb6c1"' in src
+
+
+@pytest.mark.refinegraph
+def test_refine_graph_ranks_source_and_sink_nodes():
+    """Test that the boundaries are ranked as source and sink."""
+    df = pd.DataFrame({"a": [1, 2, 3, 4]})
+    loom = Loom(df, [simple_refine_task, row_dropping_refine_task])
+    loom.run()
+
+    src = RefineGraph(loom).build(legend=False, sink_source=True).source
+    source_rank, sink_rank = src.split("rank=source")[1], src.split("rank=sink")[1]
+
+    assert '"Start DataFrame"' in source_rank.split("}")[0]
+    assert "simple_refine_task" not in source_rank.split("}")[0]
+    assert '"End DataFrame"' in sink_rank.split("}")[0]
+    assert "row_dropping_refine_task" not in sink_rank.split("}")[0]
+
+
+@refine(params_from=MyParams)
+def other_refine_with_params(df: pd.DataFrame, a: int, b: str) -> pd.DataFrame:
+    """Another refine task that uses the same spooled parameters."""
+    return df
+
+
+@pytest.mark.refinegraph
+def test_refine_graph_clusters_shared_params_once():
+    """Test that parameters shared by tasks belong to the first cluster only."""
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    loom = Loom(df, [refine_with_params, other_refine_with_params])
+    loom.run()
+
+    src = RefineGraph(loom).build(legend=False, cluster_tasks=True).source
+    first, second = src.split("subgraph cluster_")[1:3]
+
+    assert "\t\tMyParams\n" in first
+    assert "\t\ta\n" in first
+    assert "\t\tMyParams\n" not in second
+    assert "\t\ta\n" not in second
+    assert "\t\tother_refine_with_params\n" in second
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import graphviz
 import pandas as pd
 import pytest
@@ -83,6 +86,48 @@ def test_weave_graph_edges_and_colors():
     assert 'fillcolor="#fbec5d"' in src  # outputs
 
 
+@pytest.mark.weavegraph
+def test_weave_graph_node_with_several_types_is_required():
+    @weave(outputs="sum")
+    def add(a: pd.Series, b: pd.Series):
+        return a + b
+
+    @weave(outputs="scaled")
+    def scale(sum: pd.Series, k: int = 2):
+        return sum * k
+
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    loom = Loom(df, [add, scale])
+    loom.run()
+
+    graph = WeaveGraph(loom)
+    graph.build(legend=False)
+
+    # "sum" is an output of `add` and a required input of `scale`
+    assert graph.graph.nodes["sum"]["type"] == "arg_req"
+    assert graph.graph.nodes["scaled"]["type"] == "outputs"
+    assert graph.graph.nodes["k"]["type"] == "arg_opt"
+    assert list(graph.graph.nodes)[:3] == ["add", "sum", "a"]
+
+
+@pytest.mark.weavegraph
+@pytest.mark.edges
+def test_weave_graph_unstyled_edges_are_emitted():
+    @weave(outputs="y")
+    def sum_ab(a: pd.Series, b: pd.Series):
+        return a + b
+
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+    loom = Loom(df, [sum_ab])
+    loom.run()
+
+    # No timer and no optional arguments: edges carry no attributes at all
+    src = WeaveGraph(loom).build(legend=False, timer=False).source
+    assert "\ta -> sum_ab\n" in src
+    assert "\tb -> sum_ab\n" in src
+    assert "\tsum_ab -> y\n" in src
+
+
 @pytest.mark.weavegraph
 @pytest.mark.empty
 def test_weave_graph_empty_tasks_smoke():
@@ -94,3 +139,74 @@ def test_weave_graph_empty_tasks_smoke():
     assert isinstance(g, graphviz.Digraph)
     # With no tasks, we expect no edges in the DOT source
     assert "->" not in g.source
+
+
+@pytest.mark.weavegraph
+def test_weave_graph_build_is_reused_until_the_loom_runs(monkeypatch):
+    @weave(outputs="out")
+    def w(a: pd.Series):
+        return a
+
+    df = pd.DataFrame({"a": [1, 2]})
+    loom = Loom(df, [w])
+    loom.run()
+
+    weave_graph = WeaveGraph(loom)
+    setups = []
+    setup = WeaveGraph._setup
+
+    def spy(self, weaveflow_name):
+        setups.append(weaveflow_name)
+        setup(self, weaveflow_name)
+
+    monkeypatch.setattr(WeaveGraph, "_setup", spy)
+
+    g1 = weave_graph.build(legend=False)
+    g1.attr(label="changed")
+    g2 = weave_graph.build(legend=False)
+    g3 = weave_graph.build(legend=True)
+    m1, m2 = weave_graph.build_matrix(), weave_graph.build_matrix()
+
+    # Identical builds are copies of one cached graph, other arguments build anew
+    assert len(setups) == 2
+    assert g2 is not g1
+    assert "changed" not in g2.source
+    assert "cluster_legend" in g3.source
+    assert m2 is not m1
+    pd.testing.assert_frame_equal(m1, m2)
+
+    loom.run()
+    weave_graph.build(legend=False)
+    assert len(setups) == 3
+
+
+@pytest.mark.weavegraph
+def test_weave_graph_engine_skips_clusters_it_ignores():
+    @weave(outputs="out")
+    def w(a: pd.Series):
+        return a
+
+    df = pd.DataFrame({"a": [1, 2]})
+    loom = Loom(df, [w])
+    loom.run()
+
+    graph = WeaveGraph(loom)
+    g_dot = graph.build(legend=False, cluster_tasks=True)
+    g_sfdp = graph.build(legend=False, cluster_tasks=True, engine="sfdp")
+
+    assert g_dot.engine == "dot"
+    assert "cluster_w" in g_dot.source
+    assert g_sfdp.engine == "sfdp"
+    assert "cluster_w" not in g_sfdp.source
+
+
+@pytest.mark.weavegraph
+def test_importing_weaveflow_does_not_import_graph_libraries():
+    code = (
+        "import sys, weaveflow; "
+        "print('graphviz' in sys.modules, 'networkx' in sys.modules)"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
@@ -20,3 +20,16 @@ def test_weave_inference():
         "x4",
         "y1",
     }
+
+
+def test_weave_inference_returns_a_new_set_per_call():
+    first = PandasWeave._infer_columns_from_weaves([f1, f2])
+    first.add("mutated")
+    assert PandasWeave._infer_columns_from_weaves([f2, f1]) == {
+        "x1",
+        "x2",
+        "x3",
+        "x4",
+        "y1",
+    }
+    assert PandasWeave._infer_columns_from_weaves([f1]) == {"x1", "x2", "x3"}
@@ -17,6 +17,11 @@ attributes (lists, dicts) via a custom `__getattribute__` method.
     - `_outputs`: The names of the new columns the task will create.
     - `_params`: Parameters injected from a `@spool`-decorated object.
     - `_meta_mapping`: A dictionary for remapping input/output names, used by `@reweave`.
+    - `_array_input`: Whether the task receives NumPy arrays instead of Series,
+      or None to follow the `Loom` it runs in.
+    - `_out_dtype`: The dtype of the preallocated output arrays, if the task
+      writes its results into them.
+    - `_compiled`: Whether the task was compiled via `jit`.
 
 `RefineMeta`:
     Attached by the `@refine` decorator. It stores information about a
@@ -24,6 +29,9 @@ attributes (lists, dicts) via a custom `__getattribute__` method.
     - `_refine_description`: A user-provided description of the task.
     - `_on_method`: The name of the method to execute when a class is decorated.
     - `_params`: Parameters injected from a `@spool`-decorated object.
+    - `_inplace`: Whether the task modifies the DataFrame in place.
+    - `_touched_cols`: The columns an in-place task modifies, if declared.
+    - `_read_cols`: The columns the task reads, if declared.
 """
 
 from dataclasses import dataclass
@@ -45,6 +53,9 @@ class WeaveMeta:
     _outputs: list[str]
     _params: dict[str, str]
     _meta_mapping: dict[str, str] = None
+    _array_input: bool | None = None
+    _out_dtype: object = None
+    _compiled: bool = False
 
     def __getattribute__(self, name: str):
         # Intercept container access to return defensive copies
@@ -61,9 +72,9 @@ class RefineMeta:
     """
     Metadata for the Refine decorator.
 
-    This class is frozen. Container-like attributes (_params) are returned as copies
-    when accessed to prevent external mutation. Large objects (_params_object) are
-    passed through unchanged.
+    This class is frozen. Container-like attributes (_params, _touched_cols,
+    _read_cols) are returned as copies when accessed to prevent external
+    mutation. Large objects (_params_object) are passed through unchanged.
     """
 
     _refine: bool
@@ -72,9 +83,14 @@ class RefineMeta:
     _on_method: str = None
     _params: dict[str, str] = None
     _params_object: object = None
+    _inplace: bool = False
+    _touched_cols: list[str] = None
+    _read_cols: list[str] = None
 
     def __getattribute__(self, name: str):
         val = super().__getattribute__(name)
         if name == "_params" and isinstance(val, dict):
             return dict(val)
+        if name in {"_touched_cols", "_read_cols"} and isinstance(val, list):
+            return list(val)
         return val
@@ -32,7 +32,7 @@ from collections.abc import Callable
 from typing import Any
 
 from weaveflow._errors import ParamsFromIsNotASpoolError
-from weaveflow._utils import _dump_object_to_dict, _is_refine
+from weaveflow._utils import _dump_object_to_dict, _dump_str_to_list, _is_refine
 
 from .meta import RefineMeta
 
@@ -43,6 +43,9 @@ def refine(
     description: str | None = None,
     on_method: str | None = None,
     params_from: Any = None,
+    inplace: bool = False,
+    touched_columns: str | list[str] | None = None,
+    read_columns: str | list[str] | None = None,
 ) -> Callable:
     """Decorator to mark a function or class as a 'refine' task for DataFrame transformations.
 
@@ -65,6 +68,17 @@ def refine(
             from which to extract additional parameters for the function or class's
             `__init__` method (for classes) or the function itself (for functions).
             Defaults to None.
+        inplace (bool, optional): If True, the task modifies the DataFrame it
+            receives in place and its return value is ignored, so the `Loom`
+            keeps working on the same object. Defaults to False.
+        touched_columns (str | list[str] | None, optional): The columns an
+            in-place task modifies. If given, the task must not change the
+            rows or any other column, which lets the `Loom` keep its cached
+            views of all other columns. Defaults to None.
+        read_columns (str | list[str] | None, optional): The input columns
+            the task reads. If given, a `Loom` inferring its weave columns
+            (`infer_weave_columns=True`) keeps these columns as well.
+            Defaults to None.
 
     Returns:
         Callable: The decorated function or a wrapper around the decorated class,
@@ -121,6 +135,13 @@ def refine(
             _params=params,
             _params_object=params_object_name,
             _on_method=method_to_run_name,
+            _inplace=inplace,
+            _touched_cols=(
+                _dump_str_to_list(touched_columns) if touched_columns is not None else None
+            ),
+            _read_cols=(
+                _dump_str_to_list(read_columns) if read_columns is not None else None
+            ),
         )
 
         # Handle class decoration using on_method for execution plan
@@ -16,6 +16,12 @@ the `Loom` orchestrator uses to build a dependency graph:
   positional arguments are input columns from the DataFrame.
 - `params_from`: An optional argument to specify a `@spool`-decorated object
   from which to inject parameters (e.g., constants, hyperparameters).
+- `jit`: An optional compiler (e.g. `numba.njit`) applied to the function,
+  or True for `numba.njit(cache=True)`. Compiled tasks receive their input
+  columns as NumPy arrays.
+- `raw`: If True, the function receives NumPy arrays without being compiled;
+  if False, it always receives Series.
+- `out`: If set, the function writes its results into preallocated arrays.
 
 This metadata, stored in a `WeaveMeta` object, allows `weaveflow` to
 automatically manage data flow, making the pipeline declarative and easy to
@@ -31,6 +37,8 @@ of the function with the updated name mappings.
 """
 
 import functools
+import warnings
+from collections.abc import Callable
 from dataclasses import replace
 
 from weaveflow._errors import ParamsFromIsNotASpoolError
@@ -39,8 +47,54 @@ from weaveflow._utils import _dump_object_to_dict, _get_function_args, _is_weave
 from .meta import WeaveMeta
 
 
+def _numba_jit(f: Callable) -> Callable:
+    """Compiles a function with `numba.njit(cache=True)`, if numba is installed.
+
+    Without numba, a warning is issued and the function is returned as it is;
+    it still receives NumPy arrays, so the task works unchanged, only slower.
+    """
+    try:
+        import numba  # noqa: PLC0415 - optional dependency, only needed for jit=True
+    except ImportError:
+        warnings.warn(
+            f"numba is not installed, weave task {f.__name__!r} runs uncompiled.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+        return f
+    return numba.njit(cache=True)(f)
+
+
+def _resolve_jit(
+    jit: Callable | bool | None, raw: bool | None, out_dtype: str | type | None
+) -> Callable | None:
+    """Returns the compiler of a weave task, or None if it is not compiled.
+
+    Raises:
+        ValueError: If 'raw' is False and 'jit' or 'out' is provided, as these
+            tasks always receive NumPy arrays.
+    """
+    if jit is True:
+        jit = _numba_jit
+    elif jit is False:
+        jit = None
+
+    if raw is False and (jit is not None or out_dtype is not None):
+        raise ValueError(
+            "Argument 'raw' cannot be False together with 'jit' or 'out', "
+            "as these tasks always receive NumPy arrays."
+        )
+    return jit
+
+
 def weave(
-    outputs: str | list[str], nrargs: int | None = None, params_from: object = None
+    outputs: str | list[str],
+    nrargs: int | None = None,
+    params_from: object = None,
+    *,
+    jit: Callable | bool | None = None,
+    raw: bool | None = None,
+    out: bool | str | type | None = False,
 ) -> callable:
     """
     Decorator to mark a function as a 'weave' task for DataFrame transformations.
@@ -51,6 +105,9 @@ def weave(
     including input and output columns, and additional parameters that can be
     injected from a `@spool`-decorated object.
 
+    Note:
+        The execution options `jit`, `raw` and `out` are keyword-only.
+
     Args:
         outputs (str | list[str]): The name(s) of the new column(s) the function
             will create.
@@ -60,6 +117,24 @@ def weave(
         params_from (object | None, optional): An optional object decorated with
             `@spool` from which to inject parameters (e.g., constants, hyperparameters).
             Defaults to None.
+        jit (callable | bool | None, optional): A compiler such as `numba.njit`
+            that is applied to the function, or True for
+            `numba.njit(cache=True)` (uncompiled, with a warning, if numba is
+            not installed). Compiled weave tasks are called with NumPy arrays
+            of their input columns instead of pandas Series, and may return
+            arrays. Defaults to None.
+        raw (bool | None, optional): If True, the function is called with NumPy
+            arrays of its input columns instead of pandas Series, skipping the
+            Series wrappers for plain array math. Implied by `jit` and `out`,
+            which cannot be combined with False. If False, the function always
+            receives Series, even in a `Loom` created with `raw=True`.
+            Defaults to None, which follows the `Loom` (Series by default).
+        out (bool | str | type | None, optional): If set, the function receives
+            an `out` keyword with preallocated NumPy arrays sized to the
+            DataFrame (one array, or a tuple of arrays for multiple outputs),
+            writes its results into them and its return value is ignored. True
+            allocates float64 arrays; a dtype (e.g. "int64") allocates that
+            dtype. False and None leave it off. Defaults to False.
 
     Returns:
         callable: The decorated function, enhanced with weave metadata.
@@ -70,6 +145,7 @@ def weave(
                    decorated with `@spool`.
         ValueError: If 'outputs' is not a string or a list of strings.
         ValueError: If 'nrargs' is not a non-negative integer.
+        ValueError: If 'raw' is False and 'jit' or 'out' is provided.
     """
     if params_from and nrargs is not None:
         raise ValueError(
@@ -78,6 +154,10 @@ def weave(
         )
     ParamsFromIsNotASpoolError(params_from)
 
+    # The dtype of the preallocated output arrays, None if there are none
+    out_dtype = None if out is None or out is False else "float64" if out is True else out
+    jit = _resolve_jit(jit, raw, out_dtype)
+
     # Convert string to list
     if isinstance(outputs, str):
         outputs = [outputs]
@@ -93,6 +173,10 @@ def weave(
 
         # Set function attributes
         required_args, optional_args = _get_function_args(f, nrargs)
+        # The output arrays are passed by the Loom, not read from columns
+        if out_dtype is not None:
+            required_args = [arg for arg in required_args if arg != "out"]
+            optional_args = [arg for arg in optional_args if arg != "out"]
 
         params = _dump_object_to_dict(params_from)
         required_args = [arg for arg in required_args if arg not in params]
@@ -103,13 +187,18 @@ def weave(
             _oargs=optional_args,
             _outputs=outputs,
             _params=params,
+            _array_input=True if jit is not None or out_dtype is not None else raw,
+            _out_dtype=out_dtype,
+            _compiled=jit is not None,
         )
         f._weave_meta = weave_meta
+        # Compile the function if a compiler is given
+        func = f if jit is None else jit(f)
 
         # Wrap decoarated function
         @functools.wraps(f)
         def wrapper(*args, **kwargs):
-            return f(*args, **kwargs)
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -20,14 +20,14 @@ class InvalidTaskCollectionError(ValueError):
     Expected a mapping of the form:
     {
         task_name: {
-            "rargs": list[str],
-            "oargs": list[str],
-            "outputs": list[str],
-            "params": list[str]
+            "rargs": list[str] | tuple[str, ...],
+            "oargs": list[str] | tuple[str, ...],
+            "outputs": list[str] | tuple[str, ...],
+            "params": list[str] | tuple[str, ...]
             }
     }
     - Missing keys are tolerated (treated as empty), but wrong types are not.
-    - All present lists must contain strings only.
+    - All present lists or tuples must contain strings only.
     """
 
     def __init__(self, detail: str):
@@ -40,8 +40,8 @@ def _validate_registry_type(registry: dict) -> dict:
 
     Iterates through the registry and checks that all keys are strings, all values are
     dictionaries, and all metadata keys are strings. Also checks that all metadata
-    values are either strings or lists of strings, with the exception of "delta_time"
-    which can be a number.
+    values are either strings or lists/tuples of strings, with the exception of
+    "delta_time" which can be a number.
 
     Args:
         registry (dict): The registry to validate.
@@ -67,12 +67,12 @@ def _validate_registry_type(registry: dict) -> dict:
             if key == "delta_time" and not isinstance(value, (int, float)):
                 raise InvalidTaskCollectionError("Delta time must be a number")
 
-            if key != "delta_time" and not isinstance(value, (str, list)):
+            if key != "delta_time" and not isinstance(value, (str, list, tuple)):
                 raise InvalidTaskCollectionError("Metadata values must be Iterable or str")
 
             if (
                 key != "delta_time"
-                and isinstance(value, list)
+                and isinstance(value, (list, tuple))
                 and not all(isinstance(v, str) for v in value)
             ):
                 raise InvalidTaskCollectionError("Metadata lists must contain strings")
@@ -3,8 +3,8 @@ This module provides a profiling utility for tasks, particularly useful for
 tracking the performance and data flow of `@refine` tasks in `weaveflow`.
 """
 
-import time
 from collections.abc import Callable
+from time import perf_counter_ns
 from typing import Any
 
 from pandas import DataFrame
@@ -44,7 +44,7 @@ class TaskProfiler:
         rows_before = len(self._initial_data) if self._track_data else 0
 
         if self._track_time:
-            t0 = time.perf_counter()
+            t0 = perf_counter_ns()
 
         # The initial data is always passed if it exists, regardless of task signature
         # leads to more consistent API for tasks
@@ -55,10 +55,12 @@ class TaskProfiler:
 
         # Teardown & Metric Calculation
         if self._track_time:
-            self.delta_time = time.perf_counter() - t0
+            self.delta_time = (perf_counter_ns() - t0) * 1e-9
 
         if self._track_data:
-            # Correctly compare the initial row count with the RESULT's row count
-            self.rows_reduced = rows_before - len(result)
+            # Correctly compare the initial row count with the RESULT's row count,
+            # tasks working in place may return None instead of the DataFrame
+            after = self._initial_data if result is None else result
+            self.rows_reduced = rows_before - len(after)
 
         return result
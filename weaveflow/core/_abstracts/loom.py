@@ -5,7 +5,6 @@ core functionality for executing and managing `@weave` and `@refine` tasks.
 """
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
 
 
 class _BaseWeave(ABC):
@@ -20,7 +19,8 @@ class _BaseWeave(ABC):
         """
         self.weave_tasks = weave_tasks
         self.weaveflow_name = weaveflow_name
-        self.weave_collector = defaultdict(dict)
+        # The pipeline name is fixed, so its bucket is created up front
+        self.weave_collector: dict[str, dict] = {weaveflow_name: {}}
 
     @abstractmethod
     def run(self):
@@ -5,17 +5,36 @@ functionality for building and styling the dependency graphs of `@weave` and
 `@refine` tasks.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING
+
+from pandas import DataFrame
 
-import graphviz
-from networkx import DiGraph
+# graphviz and networkx are imported when the first graph is created, so that
+# importing weaveflow does not pay for them
+if TYPE_CHECKING:
+    import graphviz
+    from networkx import DiGraph
 
-from weaveflow._utils import _auto_convert_time_delta
+# Default attributes of every graph, see `_BaseGraph._get_graph_attr`
+_DEFAULT_GRAPH_ATTR = {
+    "rankdir": "LR",
+    "nodesep": "0.2",
+    "ranksep": "1.0",
+    "fontname": "Helvetica",
+    "fontsize": "10",
+    "concentrate": "true",
+}
 
 
 class _BaseGraph(ABC):
     """Abstract base class for all weaveflow graphs."""
 
+    __slots__ = ("_build_cache", "_build_cache_version", "graph", "loom")
+
     def __init__(self):
         """Initializes the _BaseGraph.
 
@@ -23,7 +42,12 @@ class _BaseGraph(ABC):
             loom (Loom): The `Loom` instance containing the execution
                 metadata to be visualized.
         """
-        self.graph = DiGraph()
+        import networkx as nx  # noqa: PLC0415 - deferred, see the module imports
+
+        self.graph = nx.DiGraph()
+        # Built graphs (and matrices) per build arguments, valid for one run
+        self._build_cache: dict[tuple, graphviz.Digraph | DataFrame] = {}
+        self._build_cache_version: int | None = None
 
     @property
     @abstractmethod
@@ -57,15 +81,58 @@ class _BaseGraph(ABC):
         """
         pass
 
+    def _cached_build(
+        self,
+        graph: graphviz.Digraph | None,
+        build_args: tuple,
+        make: Callable[[], graphviz.Digraph | DataFrame],
+    ) -> graphviz.Digraph | DataFrame:
+        """Returns a copy of the graph built with the same arguments, if any.
+
+        The collectors of a loom only change when it runs, so a built graph
+        is reused until the next run. Copies are returned, so rendering or
+        modifying a returned graph never changes the cached one. Graphs built
+        into a given `graph` are not cached.
+
+        Args:
+            graph (graphviz.Digraph | None): The graph passed to `build`.
+            build_args (tuple): The remaining arguments passed to `build`;
+                dicts (e.g. `additional_graph_attr`) are keyed by their items.
+            make (Callable[[], graphviz.Digraph | DataFrame]): Builds the graph
+                (or a `WeaveMatrix` table) on a miss.
+
+        Returns:
+            graphviz.Digraph | DataFrame: The built graph.
+        """
+        if graph is not None:
+            return make()
+        version = self.loom._collector_version
+        if version != self._build_cache_version:
+            self._build_cache.clear()
+            self._build_cache_version = version
+        key = (
+            self.loom.weaveflow_name,
+            *(tuple(sorted(a.items())) if isinstance(a, dict) else a for a in build_args),
+        )
+        cached = self._build_cache.get(key)
+        if cached is None:
+            cached = self._build_cache[key] = make()
+        return cached.copy()
+
     def _create_task_clusters(self, g: graphviz.Digraph):
         """Creates visually distinct clusters for each weave task in the graph.
 
         This helps to group a task with its direct parameter inputs, improving
         readability.
 
+        Note:
+            A node can only belong to one cluster, so parameters shared by
+            several tasks are placed in the cluster of the first task only.
+
         Args:
             g (graphviz.Digraph): The graphviz graph to modify.
         """
+        seen = set()
         for fn, vals in self._collector.items():
             with g.subgraph(name=f"cluster_{fn}") as c:
                 c.attr(
@@ -76,11 +143,10 @@ class _BaseGraph(ABC):
                     fontsize="10",
                 )
                 # Add the main task node and its parameter objects to the cluster
-                c.node(fn)
-                if vals.get("params_object"):
-                    c.node(vals["params_object"])
-                for p_node in vals.get("params", []):
-                    c.node(p_node)
+                for node in (fn, vals.get("params_object"), *(vals.get("params") or ())):
+                    if node and node not in seen:
+                        seen.add(node)
+                        c.node(node)
 
     def build(
         self,
@@ -90,6 +156,7 @@ class _BaseGraph(ABC):
         mindist: float = 1.2,
         legend: bool = True,
         sink_source: bool = False,
+        engine: str = "dot",
     ) -> graphviz.Digraph:
         """Builds and returns the Graphviz Digraph object.
 
@@ -110,6 +177,8 @@ class _BaseGraph(ABC):
                 Defaults to True.
             sink_source (bool, optional): If True, ranks source and sink nodes.
                 Defaults to False.
+            engine (str, optional): The Graphviz layout engine of a new graph.
+                Defaults to "dot".
 
         Returns:
             graphviz.Digraph: A Graphviz Digraph object representing the weave graph.
@@ -118,9 +187,10 @@ class _BaseGraph(ABC):
         """
         self._setup(self.loom.weaveflow_name)
 
-        node_styles = self._node_styles
-        clrs = {k: v[1] for k, v in node_styles.items()}
-        shapes = {k: v[0] for k, v in node_styles.items()}
+        clrs, shapes = {}, {}
+        for node_type, (shape, color) in self._node_styles.items():
+            shapes[node_type] = shape
+            clrs[node_type] = color
 
         graph_attr = _BaseGraph._get_graph_attr(
             {
@@ -136,7 +206,9 @@ class _BaseGraph(ABC):
         if isinstance(additional_graph_attr, dict):
             graph_attr.update(additional_graph_attr)
 
-        g = graph or graphviz.Digraph(graph_attr=graph_attr)
+        import graphviz  # noqa: PLC0415 - deferred, see the module imports
+
+        g = graph or graphviz.Digraph(graph_attr=graph_attr, engine=engine)
 
         # Rank source and sink nodes
         if sink_source:
@@ -150,24 +222,6 @@ class _BaseGraph(ABC):
 
         return g
 
-    @staticmethod
-    def _extract_date_from_collection(node: str, collection: dict[str, dict]) -> str:
-        """Extracts and formats the execution time for a task node.
-
-        Args:
-            node (str): The name of the task node.
-            collection (dict[str, dict]): The metadata collector (e.g.,
-                `weave_collector` or `refine_collector`).
-
-        Returns:
-            str: The formatted execution time string (e.g., "12.3") or None
-                if not available.
-        """
-        dt = collection[node]["delta_time"] if node in collection else None
-        if dt is None:
-            return None
-        return _auto_convert_time_delta(dt)
-
     def _style_graph_nodes(self, g: graphviz.Digraph, shapes: dict, colors: dict):
         """Applies styles (shape, color) to all nodes in the graph.
 
@@ -176,16 +230,19 @@ class _BaseGraph(ABC):
             shapes (dict): A dictionary mapping node types to shape names.
             colors (dict): A dictionary mapping node types to color codes.
         """
-        for k, v in self.graph.nodes.items():
-            node_type = v.get("type")
-            if node_type in shapes:
-                g.node(
-                    k,
-                    shape=shapes[node_type],
-                    style="filled",
-                    fillcolor=colors[node_type],
-                    height="0.35",
-                )
+        # Look up the attributes once per node type, not once per node
+        node_attrs = {
+            node_type: {
+                "shape": shape,
+                "style": "filled",
+                "fillcolor": colors[node_type],
+                "height": "0.35",
+            }
+            for node_type, shape in shapes.items()
+        }
+        for k, node_type in self.graph.nodes(data="type"):
+            if node_type in node_attrs:
+                g.node(k, **node_attrs[node_type])
 
     def _rank_source_and_sink_nodes(self, g: graphviz.Digraph) -> None:
         """Ranks source and sink nodes to improve graph layout.
@@ -196,9 +253,14 @@ class _BaseGraph(ABC):
         Args:
             g (graphviz.Digraph): The graphviz graph to modify.
         """
-        # Identify and rank source and sink nodes
-        source_nodes = [n for n, d in self.graph.in_degree() if d == 0]
-        sink_nodes = [n for n, d in self.graph.out_degree() if d == 0]
+        # Identify source and sink nodes in a single pass over the adjacency
+        source_nodes, sink_nodes = [], []
+        pred, succ = self.graph.pred, self.graph.succ
+        for node in self.graph:
+            if not pred[node]:
+                source_nodes.append(node)
+            if not succ[node]:
+                sink_nodes.append(node)
 
         with g.subgraph() as s:
             s.attr(rank="source")
@@ -221,15 +283,7 @@ class _BaseGraph(ABC):
         Returns:
             dict: A dictionary of graph attributes.
         """
-        graph_attr = {
-            "rankdir": "LR",
-            "nodesep": "0.2",
-            "ranksep": "1.0",
-            "fontname": "Helvetica",
-            "fontsize": "10",
-            "concentrate": "true",
-        }
-        return graph_attr | (attrs or {})
+        return _DEFAULT_GRAPH_ATTR | (attrs or {})
 
     @staticmethod
     def _add_graph_nodes(graph: DiGraph, nodes: str | list[str], **attrs) -> None:
@@ -248,19 +302,37 @@ class _BaseGraph(ABC):
         if nodes is None:
             return
 
-        if isinstance(nodes, (list, tuple)):
-            for node in nodes:
-                _BaseGraph._add_graph_nodes(graph, node, **attrs)
-            return
+        if not isinstance(nodes, (list, tuple)):
+            nodes = [nodes]
+
+        _BaseGraph._add_typed_nodes(graph, [(node, attrs.get("type")) for node in nodes])
+
+    @staticmethod
+    def _add_typed_nodes(graph: DiGraph, typed_nodes: Iterable[tuple[str, str]]) -> None:
+        """Adds nodes with their types to a networkx graph in a single call.
 
-        node = nodes
+        A node given with more than one type, or with a type other than the one
+        it already has in `graph`, gets the type 'arg_req' (see
+        `_add_graph_nodes`). Nodes that are None are skipped.
 
-        # If argument label changed, assign required (or hybrid) color
-        if node in graph.nodes:
-            if graph.nodes[node] != attrs:
-                graph.add_node(node, type="arg_req")
-        else:
-            graph.add_node(node, **attrs)
+        Args:
+            graph (nx.DiGraph): The networkx graph to modify.
+            typed_nodes (Iterable[tuple[str, str]]): Pairs of node name and type.
+        """
+        types: dict[str, str] = {}
+        for node, node_type in typed_nodes:
+            if node is None:
+                continue
+            if node in types:
+                seen = types[node]
+            elif node in graph:
+                seen = graph.nodes[node].get("type")
+            else:
+                seen = node_type
+            # If argument label changed, assign required (or hybrid) color
+            types[node] = node_type if seen == node_type else "arg_req"
+
+        graph.add_nodes_from((node, {"type": t}) for node, t in types.items())
 
     @staticmethod
     def _set_graph_legend(
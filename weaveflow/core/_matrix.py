@@ -22,12 +22,36 @@ engineering process. It is the underlying component for the
 `WeaveGraph.build_matrix()` method.
 """
 
+import sys
 from collections.abc import Mapping
+from itertools import chain
 
+import numpy as np
 import pandas as pd
 
 from weaveflow._errors import InvalidTaskCollectionError, _validate_registry_type
 
+# Bit flags describing the role of an argument for a single task
+_REQ, _OPT, _OUT = 1, 2, 4
+
+# Cell labels indexed by the OR-ed role flags. Labels are interned so that the
+# object-dtype matrix holds at most six distinct string objects. Required input
+# takes precedence over optional input when an argument is declared as both.
+_LABELS = tuple(
+    sys.intern(label)
+    for label in (
+        "",  # no role
+        "required input",  # _REQ
+        "optional input",  # _OPT
+        "required input",  # _REQ | _OPT
+        "Output",  # _OUT
+        "required input / Output",  # _REQ | _OUT
+        "optional input / Output",  # _OPT | _OUT
+        "required input / Output",  # _REQ | _OPT | _OUT
+    )
+)
+_LABEL_TABLE = np.array(_LABELS, dtype=object)
+
 
 class WeaveMatrix:
     """Matrix view for weave tasks.
@@ -60,48 +84,52 @@ class WeaveMatrix:
         task_collection = _validate_registry_type(task_collection)
         self._tasks = task_collection or {}
 
-    def build(self) -> pd.DataFrame:
-        """Construct and return the weave matrix as a pandas DataFrame."""
-        # Collect all row labels (arguments and outputs)
-        row_names: set[str] = set()
-        for meta in self._tasks.values():
-            row_names.update(meta.get("rargs", []) or [])
-            row_names.update(meta.get("oargs", []) or [])
-            row_names.update(meta.get("outputs", []) or [])
-
-        rows = sorted(row_names)
-        cols = sorted(self._tasks.keys())
+    def build(self, sort: bool = True) -> pd.DataFrame:
+        """Construct and return the weave matrix as a pandas DataFrame.
 
+        Args:
+            sort (bool, optional): If True, rows and columns are sorted
+                alphabetically. If False, they keep the order in which they
+                first appear in the task collection, which skips the sort for
+                large pipelines. Defaults to True.
+        """
         # If nothing to show, return a truly empty DataFrame (RangeIndex for index/columns)  # noqa: E501
-        if not rows and not cols:
+        if not self._tasks:
             return pd.DataFrame()
 
-        # Build column-wise data
-        data: dict[str, list[str]] = {}
-        for task_name in cols:
-            meta = self._tasks.get(task_name, {})
-            rargs = set(meta.get("rargs", []) or [])
-            oargs = set(meta.get("oargs", []) or [])
-            outputs = set(meta.get("outputs", []) or [])
-
-            col_values: list[str] = []
-            for arg in rows:
-                is_req = arg in rargs
-                is_opt = arg in oargs
-                is_out = arg in outputs
-
-                if is_req and is_out:
-                    col_values.append("required input / Output")
-                elif is_opt and is_out:
-                    col_values.append("optional input / Output")
-                elif is_req:
-                    col_values.append("required input")
-                elif is_opt:
-                    col_values.append("optional input")
-                elif is_out:
-                    col_values.append("Output")
-                else:
-                    col_values.append("")
-            data[task_name] = col_values
-
-        return pd.DataFrame(data, index=rows, columns=cols)
+        # Collect all row labels (arguments and outputs) in first-seen order
+        row_names: dict[str, None] = dict.fromkeys(
+            chain.from_iterable(
+                chain(
+                    meta.get("rargs") or (),
+                    meta.get("oargs") or (),
+                    meta.get("outputs") or (),
+                )
+                for meta in self._tasks.values()
+            )
+        )
+
+        rows = sorted(row_names) if sort else list(row_names)
+        cols = sorted(self._tasks) if sort else list(self._tasks)
+
+        # OR the role flags of every task into a (rows, cols) code array
+        row_pos = {name: i for i, name in enumerate(rows)}
+        codes = np.zeros((len(rows), len(cols)), dtype=np.uint8)
+        # The roles are read on every build, as the collection may have grown
+        for j, task_name in enumerate(cols):
+            self._fill_codes(codes[:, j], self._tasks[task_name], row_pos)
+
+        return pd.DataFrame(
+            _LABEL_TABLE[codes],
+            index=pd.Index(rows, copy=False),
+            columns=pd.Index(cols, copy=False),
+            copy=False,
+        )
+
+    @staticmethod
+    def _fill_codes(column: np.ndarray, meta: dict, row_pos: dict[str, int]) -> None:
+        """Write the role flags of a single task into its column of the code array."""
+        for flag, key in ((_REQ, "rargs"), (_OPT, "oargs"), (_OUT, "outputs")):
+            names = meta.get(key)
+            if names:
+                column[[row_pos[name] for name in names]] |= flag
@@ -26,17 +26,108 @@ Its key responsibilities include:
   and `RefineGraph`.
 """
 
-from collections import defaultdict
+import hashlib
 from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, groupby
+from time import perf_counter_ns
 from typing import override
+from weakref import WeakKeyDictionary
 
+import numpy as np
 import pandas as pd
 
-from weaveflow._errors import LoomValidator, WeaveTaskValidator
+from weaveflow._errors import InvalidLoomError, LoomValidator, WeaveTaskValidator
 from weaveflow._utils import TaskProfiler, _dump_str_to_list, _is_refine, _is_weave
 
 from ._abstracts import _BaseWeave
 
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+# pandas warns about fragmented frames beyond 100 blocks, so frames with more
+# columns are extended by a consolidating concat instead of column inserts
+_MAX_INSERT_COLUMNS = 100
+
+
+def _concat_is_lazy() -> bool:
+    """Returns whether `pd.concat` defers copies (Copy-on-Write is enabled)."""
+    return _PANDAS_MAJOR >= 3 or pd.options.mode.copy_on_write is True
+
+
+def _hash_value(digest: hashlib.blake2b, value) -> None:
+    """Feeds a task argument into a memoization digest by its content.
+
+    Arrays and pandas objects are hashed by their values (plus dtype and
+    shape, resp. index), as their reprs are truncated for large data; other
+    values by their repr.
+
+    Args:
+        digest (hashlib.blake2b): The digest to update.
+        value: The argument value.
+    """
+    if isinstance(value, np.ndarray):
+        digest.update(f"{value.dtype.str}{value.shape}".encode())
+        digest.update(pd.util.hash_array(value.ravel()))
+    elif isinstance(value, (pd.Series, pd.DataFrame, pd.Index)):
+        dtypes = value.dtypes if isinstance(value, pd.DataFrame) else value.dtype
+        digest.update(repr(dtypes).encode())
+        digest.update(pd.util.hash_pandas_object(value).to_numpy())
+    else:
+        digest.update(repr(value).encode())
+
+
+# Resolved names per task, see `_task_names`. Keyed weakly, so the cache does
+# not keep tasks (and their closures) alive once the caller drops them.
+_TASK_NAMES: WeakKeyDictionary[Callable, tuple[tuple[str, ...], ...]] = WeakKeyDictionary()
+
+
+def _task_names(weave_task: Callable) -> tuple[tuple[str, ...], ...]:
+    """Returns the argument and (possibly `@reweave`-mapped) column names of a task.
+
+    Cached on the task, so looms built repeatedly from the same tasks (e.g.
+    one per batch) resolve the names only once. The `WeaveMeta` of a task is
+    immutable, so the names never change.
+
+    Args:
+        weave_task (Callable): The `@weave` decorated function.
+
+    Returns:
+        tuple: The tuples `(required_args, optional_args, rargs_m, oargs_m,
+            outs_m, param_names)`.
+    """
+    names = _TASK_NAMES.get(weave_task)
+    if names is None:
+        weave_meta = weave_task._weave_meta
+        required_args, optional_args = weave_meta._rargs, weave_meta._oargs
+        _, rargs_m, oargs_m, outs_m = PandasWeave._resolve_effective_names(
+            weave_meta, required_args, optional_args, weave_meta._outputs
+        )
+        names = _TASK_NAMES[weave_task] = (
+            tuple(required_args),
+            tuple(optional_args),
+            *map(tuple, (rargs_m, oargs_m, outs_m)),
+            tuple(weave_meta._params),
+        )
+    return names
+
+
+def _unwrap_weave(weave_task: Callable) -> Callable:
+    """Returns the function decorated by `@weave`, without the weave wrappers.
+
+    Only the `@weave` and `@reweave` wrapper layers are removed; decorators of
+    the user applied below `@weave` (e.g. `@delayed`) are kept.
+
+    Args:
+        weave_task (Callable): The `@weave` decorated function.
+
+    Returns:
+        Callable: The decorated function.
+    """
+    func = weave_task
+    # The weave wrappers and the decorated function carry the weave metadata
+    while _is_weave(getattr(func, "__wrapped__", None)):
+        func = func.__wrapped__
+    return func
+
 
 class PandasWeave(_BaseWeave):
     """A weave that operates on pandas DataFrames.
@@ -50,7 +141,7 @@ class PandasWeave(_BaseWeave):
         weaveflow_name (str): Name for the pipeline instance.
         optionals (dict): Task-specific optional arguments.
         global_optionals (dict): Global optional arguments for all tasks.
-        weave_collector (defaultdict): A dictionary to store metadata about
+        weave_collector (dict): A dictionary to store metadata about
             each weave task execution.
     """
 
@@ -60,10 +151,21 @@ class PandasWeave(_BaseWeave):
         weave_tasks: Iterable[callable],
         weaveflow_name: str = "default",
         optionals: dict[str, dict[str]] | None = None,
+        *,
+        memoize: bool | dict = False,
+        profile: bool = True,
+        engine: Callable | None = None,
+        raw: bool = False,
         **kwargs,
     ):
         """Initializes the PandasWeave orchestrator.
 
+        Note:
+            The options `memoize`, `profile`, `engine` and `raw` are keyword
+            arguments of the constructor, so global optional arguments with
+            these names never reach the weave tasks. Pass them per task via
+            `optionals` instead. Option values of the wrong type are rejected.
+
         Args:
             database (pd.DataFrame): The initial DataFrame to process.
             weave_tasks (Iterable[Callable]): A sequence of `@weave` decorated
@@ -72,15 +174,98 @@ class PandasWeave(_BaseWeave):
                 Defaults to "default".
             optionals (dict[str, dict[str]] | None, optional): Task-specific
                 optional arguments. Defaults to None.
+            memoize (bool | dict, optional): If True, outputs of weave tasks are
+                cached by a hash of their inputs and reused when a task is run
+                again on identical data. A dict can be passed to share the
+                cache between instances; it maps each task to its cached
+                outputs. Only use with pure weave tasks. Defaults to False.
+            profile (bool, optional): If True, the execution time of each task
+                is measured and recorded. If False, a time of 0.0 is recorded.
+                Defaults to True.
+            engine (Callable | None, optional): A compiler such as
+                `numba.njit(cache=True)` applied once to every weave task run
+                by this instance, except tasks compiled via `@weave(jit=...)`
+                or declared with `@weave(raw=False)`. Compiled tasks receive
+                NumPy arrays instead of Series, as with `@weave(jit=...)`.
+                Defaults to None.
+            raw (bool, optional): If True, weave tasks receive NumPy arrays of
+                their input columns instead of Series, unless declared with
+                `@weave(raw=False)`. Defaults to False.
             **kwargs: Global optional arguments accessible by all weave tasks.
+
+        Raises:
+            InvalidLoomError: If an option has a value of the wrong type.
         """
-        # Validate weave tasks before proceeding
+        # Validate weave tasks and options before proceeding
         WeaveTaskValidator(weave_tasks).validate()
+        self._check_options(memoize=memoize, profile=profile, engine=engine, raw=raw)
         # Initialize base class and define attributes
         super().__init__(weave_tasks, weaveflow_name)
-        self.database = database
+        # Shallow copy, so that new columns never leak into the caller's frame
+        self.database = (
+            database.copy(deep=False) if isinstance(database, pd.DataFrame) else database
+        )
         self.optionals = optionals or {}
         self.global_optionals = kwargs
+        # Resolved metadata per weave task, keyed by the task itself so that the
+        # id of a garbage collected task can never be reused for a stale plan
+        self._task_plan_cache: dict[Callable, tuple] = {}
+        # Cache of weave outputs per task, keyed by a hash of their inputs
+        # (opt-in). An own cache is keyed weakly, so it never keeps tasks alive.
+        self._memo = (
+            memoize
+            if isinstance(memoize, dict)
+            else (WeakKeyDictionary() if memoize else None)
+        )
+        self._profile = profile
+        self._engine = engine
+        self._raw = raw
+        # Records of this pipeline, bound once instead of looked up per task
+        self._weave_records: dict[str, dict] = self.weave_collector[weaveflow_name]
+        # Bumped by every run, so graphs built from the records can be reused
+        self._collector_version = 0
+        # Weave output columns waiting to be added to the database in one go,
+        # ordered by the task that wrote them last
+        self._pending_cols: dict[str, pd.Series] = {}
+        # True while the inputs of the upcoming weaves are known to be available
+        self._inputs_checked = False
+        # Column names of the database as a set, and the columns Index it is for
+        self._columns_key: pd.Index | None = None
+        self._columns_set: frozenset[str] = frozenset()
+        # Column splitters specialized per tuple of output names
+        self._dumpers: dict[tuple[str, ...], Callable] = {}
+        # NumPy views of columns passed to array-input weaves, until changed
+        self._ndarray_cache: dict[str, np.ndarray] = {}
+        # Database columns passed to weaves as Series, until changed or flushed
+        self._series_cache: dict[str, pd.Series] = {}
+
+    @staticmethod
+    def _check_options(
+        memoize: bool | dict, profile: bool, engine: Callable | None, raw: bool
+    ) -> None:
+        """Validates the types of the options of the constructor.
+
+        A global optional argument meant for a weave task (e.g. `profile=5`)
+        is taken as the option of the same name instead, so such values are
+        rejected rather than silently used as options.
+
+        Raises:
+            InvalidLoomError: If an option has a value of the wrong type.
+        """
+        checks = {
+            "memoize": isinstance(memoize, (bool, dict)),
+            "profile": isinstance(profile, bool),
+            "engine": engine is None or callable(engine),
+            "raw": isinstance(raw, bool),
+        }
+        invalid = [name for name, valid in checks.items() if not valid]
+        if invalid:
+            raise InvalidLoomError(
+                f"Invalid value for the option(s) {invalid}: 'memoize' must be a "
+                "bool or dict, 'profile' and 'raw' bools and 'engine' a callable. "
+                "Optional arguments of weave tasks with these names must be passed "
+                "via `optionals`."
+            )
 
     @staticmethod
     def _infer_columns_from_weaves(weave_tasks: Iterable[Callable]) -> set[str]:
@@ -108,13 +293,10 @@ class PandasWeave(_BaseWeave):
         Raises:
             ValueError: If no arguments are found in any of the weave tasks.
         """
+        # Union the required arguments of all weave tasks
         args = set()
-
-        # Update args with the required arguments of the first weave task
-        for weave_task in weave_tasks:
-            if _is_weave(weave_task):
-                _args = weave_task._weave_meta._rargs
-                args.update(set(_args))
+        for weave_task in filter(_is_weave, weave_tasks):
+            args.update(weave_task._weave_meta._rargs)
 
         # If no weave tasks found, raise an error
         if not args:
@@ -122,6 +304,27 @@ class PandasWeave(_BaseWeave):
 
         return args
 
+    @staticmethod
+    def _infer_columns_from_refines(refine_tasks: Iterable[Callable]) -> set[str]:
+        """Collects the input columns declared by refine tasks.
+
+        Only refine tasks declared with `@refine(read_columns=...)` contribute;
+        the inputs of all other refine tasks are unknown. Tasks that are not
+        refine tasks are skipped, they are rejected by the `LoomValidator`.
+
+        Args:
+            refine_tasks (Iterable[Callable]): A sequence of `@refine`
+                decorated functions or classes.
+
+        Returns:
+            set[str]: A set of column names read by the refine tasks.
+        """
+        return {
+            col
+            for refine_task in filter(_is_refine, refine_tasks)
+            for col in refine_task._refine_meta._read_cols or ()
+        }
+
     @staticmethod
     def dump_to_frame(outputs: list[str], calculation_output: any, **kwargs):
         """Dumps calculation output into a pandas DataFrame.
@@ -144,12 +347,59 @@ class PandasWeave(_BaseWeave):
         if isinstance(calculation_output, pd.DataFrame):
             return calculation_output
 
-        calculation_output_dict = (
-            {outputs[0]: calculation_output}
-            if len(outputs) == 1
-            else dict(zip(outputs, calculation_output, strict=False))
-        )
-        return pd.DataFrame(calculation_output_dict, **kwargs)
+        if len(outputs) == 1:
+            # A single Series becomes a frame directly, without the dict path
+            if isinstance(calculation_output, pd.Series) and not kwargs:
+                return calculation_output.to_frame(name=outputs[0])
+            return pd.DataFrame({outputs[0]: calculation_output}, **kwargs)
+
+        return pd.DataFrame(dict(zip(outputs, calculation_output, strict=False)), **kwargs)
+
+    @staticmethod
+    def _make_dumper(outputs: list[str]) -> Callable:
+        """Builds a function splitting a weave output into named columns.
+
+        The single- vs multi-output branch of `dump_to_frame` is resolved once.
+        Instead of a DataFrame per task, the function returns one Series per
+        output column, aligned on the given index, which are only combined
+        into a DataFrame once per flush. DataFrame outputs are aligned on the
+        index as well and split by their own column names.
+
+        Args:
+            outputs (list[str]): The names of the output columns.
+
+        Returns:
+            Callable: A function `(calculation_output, index) ->
+                list[tuple[str, pd.Series]]`.
+        """
+
+        def split_frame(frame: pd.DataFrame, index: pd.Index) -> list:
+            # Align like the Series outputs, so later weaves never read
+            # buffered values that the flush would not keep
+            if not frame.index.equals(index):
+                frame = frame.reindex(index)
+            return list(frame.items())
+
+        if len(outputs) == 1:
+            name = outputs[0]
+
+            def dump(calculation_output: any, index: pd.Index) -> list:
+                if isinstance(calculation_output, pd.DataFrame):
+                    return split_frame(calculation_output, index)
+                return [(name, pd.Series(calculation_output, index=index, copy=False))]
+
+        else:
+            columns = list(outputs)
+
+            def dump(calculation_output: any, index: pd.Index) -> list:
+                if isinstance(calculation_output, pd.DataFrame):
+                    return split_frame(calculation_output, index)
+                return [
+                    (name, pd.Series(values, index=index, copy=False))
+                    for name, values in zip(columns, calculation_output, strict=False)
+                ]
+
+        return dump
 
     @staticmethod
     def check_intersection_columns_dataframe(
@@ -157,6 +407,12 @@ class PandasWeave(_BaseWeave):
     ) -> None:
         """Checks if a DataFrame contains all expected columns.
 
+        Note:
+            The expected names are looked up in the columns `Index`, whose
+            hash table pandas keeps, instead of copying all column names into
+            a Python set. Selections are usually much narrower than the
+            DataFrame, so this is several times faster on wide frames.
+
         Args:
             df (pd.DataFrame): The DataFrame to check.
             expected_cols (list[str]): A list of column names that are
@@ -166,26 +422,208 @@ class PandasWeave(_BaseWeave):
             KeyError: If any of the `expected_cols` are not found in the
                 DataFrame's columns.
         """
-        missing_cols = set(expected_cols) - set(df.columns)
+        columns = df.columns
+        missing_cols = {col for col in expected_cols if col not in columns}
 
         if missing_cols:
             raise KeyError(
                 f"Required columns not found in DataFrame: {sorted(list(missing_cols))}"
             )
 
-    def extend_database(self, **kwargs) -> None:
+    def extend_database(
+        self, outputs: list[str], calculation_output: any, **kwargs
+    ) -> None:
         """Extends the main DataFrame with new columns.
 
-        This method takes the output of a weave task, converts it to a
-        DataFrame using `dump_to_frame`, and concatenates it to the main
-        `database`.
+        The output of a weave task is assigned column by column into the
+        `database`, which appends new blocks instead of copying the whole
+        DataFrame as `pd.concat` would. Existing columns with the same name
+        are replaced and Series outputs are aligned on the database index.
+
+        Args:
+            outputs (list[str]): The names of the output columns.
+            calculation_output (any): The result from a weave task. This can be
+                a single Series-like object, a tuple of them or a DataFrame,
+                whose own column names are used.
+            **kwargs: Ignored, accepted for compatibility with the keyword
+                arguments of `dump_to_frame`.
+        """
+        if isinstance(calculation_output, pd.DataFrame):
+            for name in calculation_output.columns:
+                self._assign_column(name, calculation_output[name])
+        elif len(outputs) == 1:
+            self._assign_column(outputs[0], calculation_output)
+        else:
+            for name, col in zip(outputs, calculation_output, strict=False):
+                self._assign_column(name, col)
+
+    def _assign_column(self, name: str, values: any) -> None:
+        """Assigns a single column into the database.
+
+        New columns are appended via `DataFrame.insert`, which adds a block to
+        the existing frame without aligning or copying the other columns.
+        Existing columns are replaced.
 
         Args:
-            **kwargs: Keyword arguments to be passed to `dump_to_frame`.
-                Typically includes `outputs` and `calculation_output`.
+            name (str): The column name.
+            values (any): A Series, array-like or scalar to assign.
         """
-        calculation_output_frame = self.dump_to_frame(**kwargs)
-        self.database = pd.concat([self.database, calculation_output_frame], axis=1)
+        self._drop_cached_columns([name])
+        if name in self.database.columns:
+            self.database[name] = values
+        else:
+            self.database.insert(len(self.database.columns), name, values)
+
+    def _defer_extend(self, outputs: list[str], calculation_output: any) -> list[str]:
+        """Buffers the output of a weave task instead of extending the database.
+
+        Buffered columns are added to the `database` in a single step by
+        `_flush_pending`, which avoids copying the whole DataFrame (and
+        building a DataFrame) once per weave task. Later weave tasks read
+        buffered columns directly, and array-input tasks receive NumPy outputs
+        of earlier tasks in the same segment as the very same arrays.
+
+        Args:
+            outputs (list[str]): The names of the output columns.
+            calculation_output (any): The result from a weave task.
+
+        Returns:
+            list[str]: The names of the buffered columns.
+        """
+        key = tuple(outputs)
+        dump = self._dumpers.get(key)
+        if dump is None:
+            dump = self._dumpers[key] = self._make_dumper(outputs)
+        pending, cache = self._pending_cols, self._ndarray_cache
+        columns = dump(calculation_output, self.database.index)
+        for name, column in columns:
+            # Re-inserting moves a rewritten column to the position of its writer
+            pending.pop(name, None)
+            pending[name] = column
+            cache.pop(name, None)
+        # Contiguous numeric arrays are kept as they are, so consecutive
+        # array-input weaves chain their outputs without a Series round trip
+        if not isinstance(calculation_output, pd.DataFrame):
+            values = (calculation_output,) if len(outputs) == 1 else calculation_output
+            for (name, _), array in zip(columns, values, strict=False):
+                if (
+                    isinstance(array, np.ndarray)
+                    and array.ndim == 1
+                    and array.dtype.kind in "biufc"
+                    and array.flags.c_contiguous
+                ):
+                    cache[name] = array
+        return [name for name, _ in columns]
+
+    def _check_leading_weave_inputs(self, tasks: Iterable[Callable]) -> None:
+        """Validates the inputs of all weave tasks before the first refine task.
+
+        The run is simulated on column names only: starting from the database
+        columns, each weave task must find its required columns and adds its
+        outputs. The schema after a refine task is unknown until it ran, so
+        `Loom` checks each later segment of weave tasks when it is reached.
+        After a weave task returned None, `_run_weave_task` validates each
+        task on its own.
+
+        Args:
+            tasks (Iterable[Callable]): The tasks in execution order.
+
+        Raises:
+            KeyError: Listing all required columns that are neither in the
+                database nor produced by an earlier weave task.
+        """
+        available = set(self._column_set())
+        missing = set()
+        for task in tasks:
+            if not _is_weave(task):
+                break
+            _, _, _, rargs_m, _, outs_m, *_ = self._resolve_weave_task(task)
+            missing.update(c for c in rargs_m if c not in available)
+            available.update(outs_m)
+        if missing:
+            raise KeyError(f"Required columns not found in DataFrame: {sorted(missing)}")
+        self._inputs_checked = True
+
+    def _flush_pending(self) -> None:
+        """Adds all buffered weave outputs to the database at once.
+
+        Buffered columns that already exist in the database replace them (the
+        latest output wins). All other columns are built into one DataFrame,
+        aligned on the database index, and appended by a single `pd.concat`,
+        so the new columns are allocated exactly once. Without Copy-on-Write,
+        `pd.concat` copies the whole database, so there the new columns are
+        inserted into the database instead, unless it has many columns.
+        """
+        pending = self._pending_cols
+        # Columns looked up during the run may be changed before the next one
+        self._series_cache.clear()
+        if not pending:
+            return
+        database = self.database
+        for name in [name for name in pending if name in database.columns]:
+            database[name] = pending.pop(name)
+        n_columns = len(database.columns) + len(pending)
+        if pending and (_concat_is_lazy() or n_columns > _MAX_INSERT_COLUMNS):
+            block = pd.DataFrame(pending, index=database.index, copy=False)
+            self.database = pd.concat([database, block], axis=1)
+        else:
+            for name, column in pending.items():
+                database[name] = column
+        pending.clear()
+        self._ndarray_cache.clear()
+
+    def _drop_cached_columns(self, names: Iterable[str] | None = None) -> None:
+        """Drops the cached Series and arrays of changed database columns.
+
+        Args:
+            names (Iterable[str] | None, optional): The changed columns, or
+                None if any column may have changed. Defaults to None.
+        """
+        if names is None:
+            self._series_cache.clear()
+            self._ndarray_cache.clear()
+            return
+        for name in names:
+            self._series_cache.pop(name, None)
+            self._ndarray_cache.pop(name, None)
+
+    def _column_set(self) -> frozenset[str]:
+        """Returns the database column names as a set, cached until they change.
+
+        The columns `Index` is immutable and replaced whenever a column is
+        added or removed, so it identifies the cached set.
+        """
+        columns = self.database.columns
+        if columns is not self._columns_key:
+            self._columns_key, self._columns_set = columns, frozenset(columns)
+        return self._columns_set
+
+    def _get_column(self, name: str) -> pd.Series:
+        """Returns a column from the buffered outputs or the database.
+
+        Database columns are cached, so weaves reading the same inputs share
+        one Series instead of building a new one per lookup (with
+        Copy-on-Write, pandas has no item cache). The cache is dropped when
+        the columns change and at the end of each run.
+        """
+        column = self._pending_cols.get(name)
+        if column is None:
+            column = self._series_cache.get(name)
+            if column is None:
+                column = self._series_cache[name] = self.database[name]
+        return column
+
+    def _col_array(self, name: str) -> np.ndarray:
+        """Returns a contiguous NumPy array of a column, cached until it changes.
+
+        Columns of a 2D block are strided views; those (and extension arrays)
+        are copied once into a C-contiguous buffer, all others are zero-copy.
+        """
+        array = self._ndarray_cache.get(name)
+        if array is None:
+            array = np.ascontiguousarray(self._get_column(name).to_numpy())
+            self._ndarray_cache[name] = array
+        return array
 
     def _collect_optionals_for_task(
         self, weave_name: str, optional_args: list[str], weave_task: callable
@@ -205,15 +643,23 @@ class PandasWeave(_BaseWeave):
         Returns:
             dict: A dictionary of resolved optional arguments for the task.
         """
-        oargs = {
-            oarg: self.global_optionals[oarg]
-            for oarg in optional_args
-            if oarg in self.global_optionals
-        }
-        task_optionals = self.optionals.get(weave_name, {}) or self.optionals.get(
-            weave_task, {}
+        optionals, global_optionals = self.optionals, self.global_optionals
+        task_optionals = (
+            optionals.get(weave_name) or optionals.get(weave_task) if optionals else None
+        )
+        # Most pipelines pass no optionals at all, so there is nothing to collect
+        if not task_optionals and not (optional_args and global_optionals):
+            return {}
+        oargs = (
+            {
+                oarg: global_optionals[oarg]
+                for oarg in optional_args
+                if oarg in global_optionals
+            }
+            if optional_args and global_optionals
+            else {}
         )
-        oargs.update(task_optionals)
+        oargs.update(task_optionals or {})
         return oargs
 
     @staticmethod
@@ -242,7 +688,11 @@ class PandasWeave(_BaseWeave):
                 - oargs_m (list[str]): The mapped optional argument names.
                 - outs_m (list[str]): The mapped output column names.
         """
-        name_map = weave_meta._meta_mapping or {}
+        name_map = weave_meta._meta_mapping
+        # Without a mapping, all names are used as they are; the lists are
+        # fresh copies from the metadata, so they are returned without copying
+        if not name_map:
+            return {}, required_args, optional_args, outputs
         inv_map = {v: k for k, v in name_map.items()}
         # Support both directions: arg->dfcol or dfcol->arg
         rargs_m = [name_map.get(a, inv_map.get(a, a)) for a in required_args]
@@ -251,37 +701,55 @@ class PandasWeave(_BaseWeave):
         outs_m = [name_map.get(o, o) for o in outputs]
         return name_map, rargs_m, oargs_m, outs_m
 
-    @staticmethod
     def _build_required_kwargs(
-        df: pd.DataFrame, required_args: list[str], rargs_m: list[str]
+        self, required_args: list[str], rargs_m: list[str], array_input: bool = False
     ) -> dict:
         """Builds the keyword argument dictionary for calling a weave task.
 
         This method maps the original function parameter names to the
-        corresponding (potentially remapped) DataFrame columns.
+        corresponding (potentially remapped) DataFrame columns, including
+        columns buffered from earlier weave tasks.
+
+        Note:
+            Columns are looked up one by one on purpose. Selecting them as a
+            sub-frame (`df[rargs_m]`) builds a new frame and, for arrays, a
+            transposed copy, which was measured slower than the individual
+            lookups with both pandas 2 and 3. The single lookups are views,
+            and only strided columns of a 2D block are copied, once per column
+            change (see `_col_array`); a 2D selection of them keeps the block
+            layout, so its columns would still be strided.
 
         Args:
-            df (pd.DataFrame): The main DataFrame.
             required_args (list[str]): The original required argument names of
                 the function.
             rargs_m (list[str]): The mapped column names from the DataFrame.
+            array_input (bool, optional): If True, columns are passed as NumPy
+                arrays, cached across tasks until the column changes (e.g. for
+                `jit` compiled weave tasks). Defaults to False.
 
         Returns:
             dict: A dictionary of keyword arguments to be passed to the weave
                 task, where keys are the original parameter names and values
-                are the corresponding pandas Series.
+                are the corresponding pandas Series (or NumPy arrays).
         """
+        if array_input:
+            return {
+                orig: self._col_array(mapped)
+                for orig, mapped in zip(required_args, rargs_m, strict=False)
+            }
         return {
-            orig: df[mapped] for orig, mapped in zip(required_args, rargs_m, strict=False)
+            orig: self._get_column(mapped)
+            for orig, mapped in zip(required_args, rargs_m, strict=False)
         }
 
     def _record_weave_run(
         self,
         weave_name: str,
+        *,
         outputs_m: list[str],
         rargs_m: list[str],
         oargs_m: list[str],
-        params: dict,
+        params: tuple[str, ...],
         delta_time: float,
     ) -> None:
         """Records metadata about a weave task's execution.
@@ -289,38 +757,35 @@ class PandasWeave(_BaseWeave):
         This information is stored in the `weave_collector` and is used for
         generating graphs and matrices.
 
+        Note:
+            Records are plain dicts, the format that `WeaveMatrix` validates
+            and `WeaveGraph` reads. There is one record per task name and
+            pipeline, so the collector grows with the number of tasks, not with
+            the number of runs. Names are stored as tuples, which are smaller
+            than lists, read-only and hashable; the cached tuples of the task
+            plan (including the parameter names) are shared by all records of
+            a task, so recording a run allocates only the record itself.
+            Columnar storage (one list per field) or a slotted record class
+            would not save much at one record per task, and would break the
+            `record["rargs"]` lookups of the graphs, `WeaveMatrix` and users.
+
         Args:
             weave_name (str): The name of the executed weave task.
             outputs_m (list[str]): The list of (mapped) output column names.
             rargs_m (list[str]): The list of (mapped) required input columns.
             oargs_m (list[str]): The list of (mapped) optional input columns.
-            params (dict): A dictionary of parameters injected from a `@spool`
-                object.
+            params (tuple[str, ...]): The names of the parameters injected from
+                a `@spool` object.
             delta_time (float): The execution time of the task in seconds.
         """
-        self.weave_collector[self.weaveflow_name][weave_name] = {
-            "outputs": outputs_m,
-            "rargs": rargs_m,
-            "oargs": oargs_m,
-            "params": list(params),
+        self._weave_records[weave_name] = {
+            "outputs": tuple(outputs_m),
+            "rargs": tuple(rargs_m),
+            "oargs": tuple(oargs_m),
+            "params": tuple(params),
             "delta_time": delta_time,
         }
 
-    @staticmethod
-    def _call_weave(weave_task: callable, rargs: dict, oargs: dict, params: dict):
-        """Executes a weave task with the prepared arguments.
-
-        Args:
-            weave_task (callable): The weave task function to execute.
-            rargs (dict): A dictionary of required arguments (column Series).
-            oargs (dict): A dictionary of optional arguments.
-            params (dict): A dictionary of injected parameters from `@spool`.
-
-        Returns:
-            The result of the weave task execution.
-        """
-        return weave_task(**rargs, **oargs, **params)
-
     def _optionals_from_kwargs(self, weave_name: str, weave_optionals: list[str]) -> dict:
         """Populates task-specific optionals from global kwargs.
 
@@ -340,16 +805,183 @@ class PandasWeave(_BaseWeave):
             if oarg in self.kwargs:
                 self.optionals[weave_name].update({oarg: self.kwargs[oarg]})
 
+    def _resolve_weave_task(self, weave_task: callable) -> tuple:
+        """Resolves the metadata of a weave task once and caches the result.
+
+        The `WeaveMeta` of a task is immutable, so its extracted pieces and the
+        (possibly `@reweave`-mapped) column names are computed on the first
+        run of the task and reused by every later run of this instance; the
+        names are shared across instances (see `_task_names`). If the
+        instance has an `engine`, the function below the weave wrappers is
+        compiled here, once per task, unless the task was already compiled
+        via `jit` or is declared with `raw=False`. Tasks declared with `out`
+        are wrapped to receive preallocated output arrays. The mapped names
+        are kept as tuples, which the records of every run share instead of
+        copying them.
+
+        Args:
+            weave_task (callable): The `@weave` decorated function.
+
+        Returns:
+            A tuple of `(params, required_args, optional_args, rargs_m,
+            oargs_m, outs_m, array_input, call, param_names)`, where `call` is
+            the callable to execute.
+        """
+        plan = self._task_plan_cache.get(weave_task)
+        if plan is None:
+            weave_meta = weave_task._weave_meta
+            required_args, optional_args, rargs_m, oargs_m, outs_m, param_names = (
+                _task_names(weave_task)
+            )
+            plan = (
+                weave_meta._params,
+                required_args,
+                optional_args,
+                rargs_m,
+                oargs_m,
+                outs_m,
+            )
+            # Tasks compiled via `jit` or declared with `raw=False` aren't compiled
+            if (
+                self._engine is None
+                or weave_meta._compiled
+                or weave_meta._array_input is False
+            ):
+                # Tasks without an own choice follow the instance's `raw`
+                meta_array_input = weave_meta._array_input
+                array_input = self._raw if meta_array_input is None else meta_array_input
+                call = weave_task
+            else:
+                array_input, call = True, self._engine(_unwrap_weave(weave_task))
+            if weave_meta._out_dtype is not None:
+                call = self._preallocating(call, len(outs_m), weave_meta._out_dtype)
+            plan += (array_input, call, param_names)
+            self._task_plan_cache[weave_task] = plan
+        return plan
+
+    def _preallocating(self, call: Callable, n_outputs: int, dtype: object) -> Callable:
+        """Wraps a weave task that writes its results into preallocated arrays.
+
+        The output arrays are the rows of one C-contiguous block sized to the
+        current database. They are passed as `out` (a single array, or a tuple
+        for multiple outputs) and returned as the output of the task, so they
+        are buffered without another copy.
+
+        Args:
+            call (Callable): The weave task (or its compiled function).
+            n_outputs (int): The number of output columns.
+            dtype (object): The dtype of the output arrays.
+
+        Returns:
+            Callable: A function with the keyword arguments of the task.
+        """
+
+        def run(**kwargs):
+            block = np.empty((n_outputs, len(self.database.index)), dtype=dtype)
+            out = block[0] if n_outputs == 1 else tuple(block)
+            call(**kwargs, out=out)
+            return out
+
+        return run
+
+    def _weave_layers(self, weave_tasks: list[Callable]) -> list[list[int]]:
+        """Groups consecutive weave tasks into layers of independent tasks.
+
+        A task depends on an earlier task if it reads one of its outputs, or
+        writes a column the earlier task reads or writes. Each task is placed
+        in the layer after the latest layer it depends on (Kahn's algorithm on
+        the ordered task list), so running layer by layer keeps the results
+        of a sequential run. The latest layer reading and writing each column
+        is tracked, so the grouping is linear in the number of names.
+
+        Args:
+            weave_tasks (list[Callable]): Consecutive `@weave` tasks in
+                execution order.
+
+        Returns:
+            list[list[int]]: The layers in execution order as positions in
+                `weave_tasks`, each keeping the original order of its tasks.
+        """
+        layers: list[list[int]] = []
+        last_read: dict[str, int] = {}
+        last_write: dict[str, int] = {}
+        for position, weave_task in enumerate(weave_tasks):
+            _, _, _, rargs_m, _, outs_m, *_ = self._resolve_weave_task(weave_task)
+            level = 1 + max(
+                chain(
+                    (last_write.get(c, -1) for c in rargs_m),
+                    (max(last_read.get(c, -1), last_write.get(c, -1)) for c in outs_m),
+                ),
+                default=-1,
+            )
+            for c in rargs_m:
+                last_read[c] = max(last_read.get(c, -1), level)
+            for c in outs_m:
+                last_write[c] = max(last_write.get(c, -1), level)
+            if level == len(layers):
+                layers.append([])
+            layers[level].append(position)
+        return layers
+
+    def _task_memo(self, weave_task: callable) -> dict | None:
+        """Returns the cached outputs of a weave task, if memoization is on.
+
+        Outputs are cached per task object, not per task name, so tasks with
+        the same name (e.g. closures made by one factory) never share outputs.
+
+        Args:
+            weave_task (callable): The weave task function.
+
+        Returns:
+            dict | None: The outputs of the task by memoization key, or None
+                if memoization is off.
+        """
+        memo = self._memo
+        if memo is None:
+            return None
+        task_memo = memo.get(weave_task)
+        if task_memo is None:
+            task_memo = memo[weave_task] = {}
+        return task_memo
+
+    @staticmethod
+    def _memo_key(rargs: dict, oargs: dict, params: dict) -> bytes:
+        """Builds the memoization key of a weave task call.
+
+        The key is a content hash of the required input columns (including the
+        index), the optional arguments and the parameters, see `_hash_value`.
+        It identifies a call within the cached outputs of one task, see
+        `_task_memo`.
+
+        Args:
+            rargs (dict): The required input columns (Series or NumPy arrays)
+                by argument name.
+            oargs (dict): The resolved optional arguments.
+            params (dict): The injected `@spool` parameters.
+
+        Returns:
+            bytes: A digest identifying the call.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for args in (rargs, oargs, params):
+            # Separate the argument groups, so values can't shift between them
+            digest.update(b"\0")
+            for name in sorted(args):
+                digest.update(name.encode())
+                _hash_value(digest, args[name])
+        return digest.digest()
+
     def _run_weave_task(self, weave_task: callable) -> None:
         """Executes a single weave task and records its metadata.
 
         This method orchestrates the entire lifecycle of a single weave task:
-        1. Extracts metadata from the task.
+        1. Extracts metadata from the task and remaps input/output names if
+           necessary (`@reweave`), both cached per task.
         2. Resolves optional arguments.
-        3. Remaps input/output names if necessary (`@reweave`).
-        4. Validates that required columns exist.
-        5. Prepares arguments and calls the task.
-        6. Records execution time and metadata.
+        3. Validates that required columns exist, unless that was done for
+           the whole segment by `_check_leading_weave_inputs`.
+        4. Prepares arguments and calls the task.
+        5. Records execution time and metadata.
 
         Args:
             weave_task (callable): The `@weave` decorated function to run.
@@ -361,39 +993,65 @@ class PandasWeave(_BaseWeave):
                 - weave_name (str): The name of the weave task.
         """
         weave_name = weave_task.__name__
-        weave_meta = weave_task._weave_meta
 
-        # Extract meta pieces
-        params = weave_meta._params
-        required_args = weave_meta._rargs
-        optional_args = weave_meta._oargs
-        outputs = weave_meta._outputs
+        # Extract meta pieces and resolved names (cached across runs)
+        (
+            params,
+            required_args,
+            optional_args,
+            rargs_m,
+            oargs_m,
+            outs_m,
+            array_input,
+            call,
+            param_names,
+        ) = self._resolve_weave_task(weave_task)
 
         # Collect optionals
         oargs = self._collect_optionals_for_task(weave_name, optional_args, weave_task)
 
-        # Resolve names and validate presence
-        _, rargs_m, oargs_m, outs_m = self._resolve_effective_names(
-            weave_meta, required_args, optional_args, outputs
-        )
-        self.check_intersection_columns_dataframe(df=self.database, expected_cols=rargs_m)
+        # Validate presence of required columns unless checked before the run
+        if not self._inputs_checked:
+            columns, pending = self._column_set(), self._pending_cols
+            missing = {c for c in rargs_m if c not in columns and c not in pending}
+            if missing:
+                raise KeyError(
+                    f"Required columns not found in DataFrame: {sorted(missing)}"
+                )
         # Build kwargs and execute
-        rargs = self._build_required_kwargs(self.database, required_args, rargs_m)
-        # Execute with timing for graph edges
-        task_profiler = TaskProfiler(
-            self._call_weave,
-            track_time=True,
-        )
-        calculation_output = task_profiler.run(weave_task, rargs, oargs, params)
-        # Record all relevant information for graph/matrix
-        self._record_weave_run(
-            weave_name=weave_name,
-            outputs_m=outs_m,
-            rargs_m=rargs_m,
-            oargs_m=oargs_m,
-            params=params,
-            delta_time=task_profiler.delta_time,
-        )
+        rargs = self._build_required_kwargs(required_args, rargs_m, array_input)
+        # Reuse the output of an identical earlier call if memoization is on
+        task_memo = self._task_memo(weave_task)
+        memo_key = self._memo_key(rargs, oargs, params) if task_memo is not None else None
+        if memo_key is not None and memo_key in task_memo:
+            calculation_output, delta_time = task_memo[memo_key], 0.0
+        else:
+            # Execute with timing for graph edges (unless profiling is off). The
+            # call is inlined, as per-task helper frames add up on tiny tasks.
+            # The argument dicts are unpacked into the call without a merged
+            # dict; unpacking empty dicts costs next to nothing.
+            if self._profile:
+                t0 = perf_counter_ns()
+                calculation_output = call(**rargs, **oargs, **params)
+                delta_time = (perf_counter_ns() - t0) * 1e-9
+            else:
+                calculation_output = call(**rargs, **oargs, **params)
+                delta_time = 0.0
+            if memo_key is not None:
+                task_memo[memo_key] = calculation_output
+        # Record all relevant information for graph/matrix; a skipped task drops
+        # the record of an earlier run, as its outputs no longer exist
+        if calculation_output is not None:
+            self._record_weave_run(
+                weave_name=weave_name,
+                outputs_m=outs_m,
+                rargs_m=rargs_m,
+                oargs_m=oargs_m,
+                params=param_names,
+                delta_time=delta_time,
+            )
+        else:
+            self._weave_records.pop(weave_name, None)
 
         return calculation_output, outs_m, weave_name
 
@@ -402,23 +1060,25 @@ class PandasWeave(_BaseWeave):
 
         This method iterates through all the `weave_tasks` provided during
         initialization, runs each one, and extends the main DataFrame with
-        the results.
+        the results. Outputs are buffered, read directly by later tasks and
+        concatenated once after the last task, or after a failing task.
         """
-        for weave_task in self.weave_tasks:
-            calculation_output, outputs, weave_name = self._run_weave_task(weave_task)
+        self._collector_version += 1
+        self._check_leading_weave_inputs(self.weave_tasks)
+        # Outputs of the tasks run before a failing one still reach the database
+        try:
+            for weave_task in self.weave_tasks:
+                calculation_output, outputs, _ = self._run_weave_task(weave_task)
 
-            if calculation_output is None:
-                self.weave_collector[self.weaveflow_name].pop(weave_name)
-                continue
+                if calculation_output is None:
+                    self._inputs_checked = False
+                    continue
 
-            # TODO: Add option to extend database 'database_t' or 'self.database'
-            # Extend the database with the calculation output
-            self.extend_database(
-                outputs=outputs,
-                calculation_output=calculation_output,
-                index=self.database.index,
-                columns=outputs,
-            )
+                # Buffer the calculation output, the database is extended at the end
+                self._defer_extend(outputs, calculation_output)
+
+        finally:
+            self._flush_pending()
 
 
 class Loom(PandasWeave):
@@ -444,7 +1104,7 @@ class Loom(PandasWeave):
         kwargs (Any): Additional keyword arguments passed to the Loom
             constructor, which are treated as global optional parameters
             available to weave tasks.
-        refine_collector (defaultdict): Stores metadata about executed refine tasks.
+        refine_collector (dict): Stores metadata about executed refine tasks.
     """
 
     def __init__(
@@ -457,10 +1117,22 @@ class Loom(PandasWeave):
         refine_columns: str | list[str] | None = None,
         weave_columns: str | list[str] | None = None,
         columns: str | list[str] | None = None,
+        *,
+        memoize: bool | dict = False,
+        profile: bool = True,
+        dtype_backend: str | None = None,
+        engine: Callable | None = None,
+        raw: bool = False,
         **kwargs,
     ):
         """Initializes the Loom orchestrator.
 
+        Note:
+            The options `memoize`, `profile`, `dtype_backend`, `engine` and
+            `raw` are keyword-only arguments, so global optional arguments with
+            these names never reach the weave tasks. Pass them per task via
+            `optionals` instead. Option values of the wrong type are rejected.
+
         Args:
             database (pd.DataFrame): The initial DataFrame to process.
             tasks (Iterable[Callable]): A sequence of `@weave` and `@refine`
@@ -469,12 +1141,35 @@ class Loom(PandasWeave):
                 Defaults to "default".
             optionals (dict[str, dict[str]] | None, optional): Task-specific
                 optional arguments. Defaults to None.
+            memoize (bool | dict, optional): If True, reuses outputs of weave
+                tasks run on identical inputs. A dict can be passed to share
+                the cache between Loom instances. Defaults to False.
+            profile (bool, optional): If False, task execution times are not
+                measured, which saves the timing overhead on pipelines with
+                many small tasks. Defaults to True.
+            dtype_backend (str | None, optional): If given ("numpy_nullable" or
+                "pyarrow"), the selected columns are converted with
+                `DataFrame.convert_dtypes` before any task runs. "pyarrow"
+                requires pyarrow to be installed. Defaults to None.
+            engine (Callable | None, optional): A compiler such as `numba.njit`
+                applied once to every weave task not compiled via
+                `@weave(jit=...)` nor declared with `@weave(raw=False)`.
+                Compiled tasks receive NumPy arrays instead of Series.
+                Defaults to None.
+            raw (bool, optional): If True, weave tasks receive NumPy arrays of
+                their input columns instead of Series, which skips the index
+                alignment of Series arithmetic. Tasks declared with
+                `@weave(raw=False)` keep receiving Series. Defaults to False.
             **kwargs: Global optional arguments accessible by weave tasks.
         """
         # TODO: Introduce verbose mode extend graphical information (e.g. add arg types)
         all_tasks = list(tasks)
+        # Resolve the task types once: pairs of (task, is_weave), valid since
+        # the validation in __pre_init__ ensures every task is weave or refine
+        dispatch = [(task, _is_weave(task)) for task in all_tasks]
         # Filter only weave tasks
-        filtered_weave_tasks = [task for task in tasks if _is_weave(task)]
+        filtered_weave_tasks = [task for task, is_weave in dispatch if is_weave]
+        refine_tasks = [task for task, is_weave in dispatch if not is_weave]
         # Pre-select columns if specified by user
         database = self._pre_select_columns(
             database=database,
@@ -483,13 +1178,26 @@ class Loom(PandasWeave):
             refine_columns=refine_columns,
             weave_columns=weave_columns,
             columns=columns,
+            refine_tasks=refine_tasks,
         )
+        if dtype_backend is not None and isinstance(database, pd.DataFrame):
+            database = database.convert_dtypes(dtype_backend=dtype_backend)
         # TODO: Loom being the main workflow orchestrator, differ between PandasWeave, DaskWeave, etc.  # noqa: E501
         super().__init__(
-            database, filtered_weave_tasks, weaveflow_name, optionals, **kwargs
+            database,
+            filtered_weave_tasks,
+            weaveflow_name,
+            optionals,
+            memoize=memoize,
+            profile=profile,
+            engine=engine,
+            raw=raw,
+            **kwargs,
         )
         self.tasks = all_tasks  # All tasks
-        self.refine_collector = defaultdict(dict)
+        self._dispatch: list[tuple[Callable, bool]] = dispatch
+        self.refine_collector: dict[str, dict] = {weaveflow_name: {}}
+        self._refine_records: dict[str, dict] = self.refine_collector[weaveflow_name]
         self.__pre_init__()
 
     def _pre_select_columns(
@@ -500,6 +1208,7 @@ class Loom(PandasWeave):
         refine_columns: str | list[str] | None = None,
         weave_columns: str | list[str] | None = None,
         columns: str | list[str] | None = None,
+        refine_tasks: Iterable[Callable] | None = None,
     ) -> pd.DataFrame:
         """Pre-selects columns from the input DataFrame based on user specifications.
 
@@ -511,7 +1220,8 @@ class Loom(PandasWeave):
         Args:
             database (pd.DataFrame): The initial DataFrame.
             infer_weave_columns (str | bool, optional): If True, automatically
-                infers required columns from `weave_tasks`. Defaults to False.
+                infers required columns from `weave_tasks`, plus the columns
+                declared as read by `refine_tasks`. Defaults to False.
             weave_tasks (Iterable[Callable] | None, optional): The weave tasks
                 to use for column inference. Required if `infer_weave_columns`
                 is True. Defaults to None.
@@ -522,6 +1232,9 @@ class Loom(PandasWeave):
             columns (str | list[str] | None, optional): A list of columns to
                 keep for the entire pipeline, overriding all other column
                 selection arguments. Defaults to None.
+            refine_tasks (Iterable[Callable] | None, optional): The refine
+                tasks whose declared input columns are kept when inferring
+                columns. Defaults to None.
 
         Returns:
             pd.DataFrame: A DataFrame containing only the selected columns.
@@ -558,8 +1271,9 @@ class Loom(PandasWeave):
                     "Cannot infer weave columns without providing weave tasks."
                 )
             inferred_cols = self._infer_columns_from_weaves(weave_tasks)
-            # Filter to only columns that actually exist in the input DataFrame
-            final_weave_cols = [col for col in inferred_cols if col in database.columns]
+            inferred_cols |= self._infer_columns_from_refines(refine_tasks or ())
+            # Keep the inferred columns that exist, in the order of the DataFrame
+            final_weave_cols = [col for col in database.columns if col in inferred_cols]
 
         final_cols = final_refine_cols + final_weave_cols
 
@@ -567,9 +1281,6 @@ class Loom(PandasWeave):
         if not final_cols:
             return database
 
-        # Combine refine and weave columns
-        columns = (refine_columns or []) + (weave_columns or [])
-
         # Remove duplicates while preserving order and validate
         unique_final_cols = list(dict.fromkeys(final_cols))
         self.check_intersection_columns_dataframe(database, unique_final_cols)
@@ -582,13 +1293,23 @@ class Loom(PandasWeave):
         """Performs pre-initialization checks for the Loom.
 
         Ensures that the `tasks` attribute is an iterable of callables and
-        that each task is decorated with either `@weave` or `@refine`.
+        that each task is decorated with either `@weave` or `@refine`. The
+        task types are resolved once in `__init__`, so `_run` does not inspect
+        each task again on every run, and the consecutive runs of weave and
+        refine tasks used by `_run_parallel` are grouped here once as well.
 
         Raises:
             TypeError: If `tasks` is not an iterable or contains an invalid
                 task type.
         """
         LoomValidator(self.database, self.optionals, self.tasks).validate()
+        # Pairs of (is_weave, tasks) for each run of consecutive tasks of a type
+        self._segments: list[tuple[bool, list[Callable]]] = [
+            (is_weave, [task for task, _ in group])
+            for is_weave, group in groupby(self._dispatch, key=lambda item: item[1])
+        ]
+        # Layers of independent weave tasks per segment index, built on first use
+        self._segment_layers: dict[int, list[list[int]]] = {}
 
     def _record_refine_run(
         self,
@@ -615,7 +1336,7 @@ class Loom(PandasWeave):
             description (str): The user-provided description of the task.
             delta_time (float): The execution time of the task in seconds.
         """
-        self.refine_collector[self.weaveflow_name][refine_task_name] = {
+        self._refine_records[refine_task_name] = {
             "on_method": on_method,
             "params": params,
             "params_object": params_object,
@@ -629,6 +1350,12 @@ class Loom(PandasWeave):
 
         A refine task receives the entire DataFrame and is expected to return
         a transformed DataFrame, which replaces the Loom's internal `database`.
+        The replaced frame (and its cached arrays) is not referenced anymore,
+        so it is freed by reference counting right away, without waiting for
+        a garbage collection. In-place refine tasks (`@refine(inplace=True)`)
+        modify the `database` itself; if they declare their touched columns,
+        only the cached arrays of those columns are dropped. A task returning
+        None is treated as in-place as well, so the `database` is kept.
 
         Args:
             refine_task (callable): The `@refine` decorated function or class
@@ -636,18 +1363,34 @@ class Loom(PandasWeave):
         """
         # Get the meta information from refine object
         refine_meta = refine_task._refine_meta
-        refine_name = refine_meta._refine_name
         # Run calculation through profiler and build nodes for the graph
         task_profiler = TaskProfiler(
             refine_task,
-            track_time=True,
+            track_time=self._profile,
             track_data=True,
             data=self.database,
         )
-        self.database = task_profiler.run()
+        result = task_profiler.run()
+        touched_cols = refine_meta._touched_cols
+        if not refine_meta._inplace and result is not None:
+            self.database = result
+            self._drop_cached_columns()
+        else:
+            self._drop_cached_columns(touched_cols)
+        # A refine task may drop columns, so the next weaves are checked again
+        self._inputs_checked = False
         # Record all relevant information for refine graph
+        self._record_refine_profile(refine_meta, task_profiler)
+
+    def _record_refine_profile(self, refine_meta, task_profiler: TaskProfiler) -> None:
+        """Records a refine run from its metadata and the profiler that ran it.
+
+        Args:
+            refine_meta: The `RefineMeta` object attached to the task.
+            task_profiler (TaskProfiler): The profiler the task was run with.
+        """
         self._record_refine_run(
-            refine_task_name=refine_name,
+            refine_task_name=refine_meta._refine_name,
             on_method=refine_meta._on_method,
             params=list(refine_meta._params),
             params_object=refine_meta._params_object,
@@ -656,37 +1399,234 @@ class Loom(PandasWeave):
             rows_reduced=task_profiler.rows_reduced,
         )
 
+    @staticmethod
+    def _refine_groups(refine_tasks: list[Callable]) -> list[list[Callable]]:
+        """Groups consecutive refine tasks that can run concurrently.
+
+        Only in-place refine tasks that declare their touched columns can be
+        grouped, and only while their touched columns are pairwise disjoint,
+        so a group gives the same result in any order. Every other refine task
+        forms a group of its own.
+
+        Args:
+            refine_tasks (list[Callable]): Consecutive `@refine` tasks in
+                execution order.
+
+        Returns:
+            list[list[Callable]]: The groups in execution order.
+        """
+        groups: list[list[Callable]] = []
+        current: list[Callable] = []
+        touched: set[str] = set()
+        for task in refine_tasks:
+            meta = task._refine_meta
+            cols = set(meta._touched_cols or ()) if meta._inplace else set()
+            if not cols or cols & touched:
+                if current:
+                    groups.append(current)
+                current, touched = [], set()
+            if not cols:
+                groups.append([task])
+                continue
+            current.append(task)
+            touched |= cols
+        if current:
+            groups.append(current)
+        return groups
+
+    def _run_refine_group(
+        self, refine_tasks: list[Callable], executor: ThreadPoolExecutor
+    ) -> None:
+        """Runs in-place refine tasks with disjoint touched columns concurrently.
+
+        Each task works on its own shallow copy of the `database`, so no two
+        threads modify the same DataFrame. Afterwards, the touched columns of
+        each copy are assigned back and the runs are recorded in task order.
+
+        Args:
+            refine_tasks (list[Callable]): A group built by `_refine_groups`.
+            executor (ThreadPoolExecutor): The executor to run the tasks in.
+        """
+        views = [self.database.copy(deep=False) for _ in refine_tasks]
+        profilers = [
+            TaskProfiler(task, track_time=self._profile, track_data=True, data=view)
+            for task, view in zip(refine_tasks, views, strict=True)
+        ]
+        list(executor.map(TaskProfiler.run, profilers))
+        for task, view, task_profiler in zip(refine_tasks, views, profilers, strict=True):
+            refine_meta = task._refine_meta
+            for name in refine_meta._touched_cols:
+                self.database[name] = view[name]
+                self._drop_cached_columns([name])
+            self._record_refine_profile(refine_meta, task_profiler)
+        self._inputs_checked = False
+
     def _run(self):
-        """Internal method to execute the full pipeline of tasks."""
-        for task in self.tasks:
-            # If task is a weave task, calculate new columns and add them to the database
-            if _is_weave(task):
-                # Run weave task on task arguments according to meta information
-                calculation_output, outputs, weave_name = self._run_weave_task(task)
-
-                # If calculation output is None, skip the task
-                if calculation_output is None:
-                    self.weave_collector[self.weaveflow_name].pop(weave_name)
+        """Internal method to execute the full pipeline of tasks.
+
+        The weave tasks of each segment are validated at once before the first
+        of them runs (see `_check_leading_weave_inputs`), so `_run_weave_task`
+        only checks its inputs itself after a weave task returned None.
+        """
+        self._check_leading_weave_inputs(self.tasks)
+        # Outputs of the tasks run before a failing one still reach the database
+        try:
+            for is_weave, segment in self._segments:
+                # Refine tasks refine the fully extended database
+                if not is_weave:
+                    self._flush_pending()
+                    for task in segment:
+                        self._run_refine_task(task)
                     continue
 
-                # Extend the database with the calculation output
-                self.extend_database(
-                    outputs=outputs,
-                    calculation_output=calculation_output,
-                    index=self.database.index,
-                    columns=outputs,
-                )
+                # The schema after a refine task is known now, check the segment
+                if not self._inputs_checked:
+                    self._check_leading_weave_inputs(segment)
+                for task in segment:
+                    # Run weave task on task arguments according to meta information
+                    calculation_output, outputs, _ = self._run_weave_task(task)
+
+                    # If calculation output is None, skip the task
+                    if calculation_output is None:
+                        self._inputs_checked = False
+                        continue
+
+                    # Buffer the calculation output until the database is needed
+                    self._defer_extend(outputs, calculation_output)
+        finally:
+            self._flush_pending()
 
-            # If task is a refine task, refine the database
-            elif _is_refine(task):
-                self._run_refine_task(task)
+    def _segment_weave_layers(
+        self, index: int, weave_tasks: list[Callable]
+    ) -> list[list[int]]:
+        """Returns the layers of a weave segment, built once per instance.
+
+        Args:
+            index (int): The position of the segment in `_segments`.
+            weave_tasks (list[Callable]): The weave tasks of the segment.
+
+        Returns:
+            list[list[int]]: The layers as returned by `_weave_layers`.
+        """
+        # Task plans are fixed per instance, so are the layers
+        layers = self._segment_layers.get(index)
+        if layers is None:
+            layers = self._segment_layers[index] = self._weave_layers(weave_tasks)
+        return layers
+
+    def _reorder_pending(self, written: list[tuple[int, list[str]]]) -> None:
+        """Reorders the buffered columns by the position of their writing task.
+
+        Args:
+            written (list[tuple[int, list[str]]]): The task positions and the
+                names of the columns each task buffered.
+        """
+        pending = self._pending_cols
+        ordered: dict[str, pd.Series] = {}
+        for _, names in sorted(written, key=lambda item: item[0]):
+            for name in names:
+                ordered.pop(name, None)
+                ordered[name] = pending[name]
+        pending.clear()
+        pending.update(ordered)
+
+    def _run_refine_segment(
+        self, refine_tasks: list[Callable], executor: ThreadPoolExecutor
+    ) -> None:
+        """Runs consecutive refine tasks, independent in-place groups concurrently.
+
+        Args:
+            refine_tasks (list[Callable]): The refine tasks of a segment.
+            executor (ThreadPoolExecutor): The executor to run groups in.
+        """
+        self._flush_pending()
+        for refine_group in self._refine_groups(refine_tasks):
+            if len(refine_group) == 1:
+                self._run_refine_task(refine_group[0])
+            else:
+                self._run_refine_group(refine_group, executor)
+
+    def _run_weave_segment(
+        self, index: int, weave_tasks: list[Callable], executor: ThreadPoolExecutor
+    ) -> None:
+        """Runs consecutive weave tasks, the tasks of each layer concurrently.
+
+        Args:
+            index (int): The position of the segment in `_segments`.
+            weave_tasks (list[Callable]): The weave tasks of the segment.
+            executor (ThreadPoolExecutor): The executor to run layers in.
+        """
+        bucket = self._weave_records
+        if not self._inputs_checked:
+            self._check_leading_weave_inputs(weave_tasks)
+        recorded = set(bucket)
+        written: list[tuple[int, list[str]]] = []
+        for layer in self._segment_weave_layers(index, weave_tasks):
+            results = executor.map(self._run_weave_task, [weave_tasks[i] for i in layer])
+            for position, (calculation_output, outputs, _) in zip(
+                layer, results, strict=True
+            ):
+                if calculation_output is None:
+                    self._inputs_checked = False
+                    continue
+                names = self._defer_extend(outputs, calculation_output)
+                written.append((position, names))
+
+        # Restore the execution order of the outputs and the records
+        self._reorder_pending(written)
+        for name in dict.fromkeys(task.__name__ for task in weave_tasks):
+            if name in bucket and name not in recorded:
+                bucket[name] = bucket.pop(name)
+
+    def _run_parallel(self, max_workers: int | None = None):
+        """Internal method to execute the pipeline with independent weaves in parallel.
+
+        Consecutive weave tasks are grouped into layers of mutually independent
+        tasks (see `_weave_layers`), and the tasks of a layer are run in a
+        thread pool. Refine tasks act as barriers. Buffered outputs are
+        concatenated in task order before a refine task and at the end of the
+        run, also when a task raises. Consecutive in-place refine tasks with
+        disjoint touched columns are run concurrently as well (see
+        `_refine_groups`).
+
+        Args:
+            max_workers (int | None, optional): Maximum number of threads.
+                Defaults to None, the `ThreadPoolExecutor` default.
+        """
+        self._check_leading_weave_inputs(self.tasks)
+        # Outputs of the tasks run before a failing one still reach the database
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for index, (is_weave, segment) in enumerate(self._segments):
+                    if is_weave:
+                        self._run_weave_segment(index, segment, executor)
+                    else:
+                        self._run_refine_segment(segment, executor)
+        finally:
+            self._flush_pending()
 
     @override
-    def run(self):
+    def run(self, parallel: bool = False, max_workers: int | None = None):
         """Executes the full weaveflow pipeline.
 
         This method iterates through the provided `tasks`, dispatching to
         `_run_weave_task` or `_run_refine_task` as appropriate, and manages
         the state of the internal DataFrame.
+
+        Args:
+            parallel (bool, optional): If True, weave tasks that do not depend
+                on each other are run concurrently in a thread pool. This pays
+                off for weave tasks that release the GIL (e.g. NumPy/pandas
+                heavy computations, or tasks compiled by an `engine` such as
+                `functools.partial(numba.njit, nogil=True)`). Defaults to False.
+            max_workers (int | None, optional): Maximum number of threads used
+                when `parallel` is True. Defaults to None.
         """
-        self._run()
+        self._collector_version += 1
+        if parallel:
+            self._run_parallel(max_workers)
+        else:
+            self._run()
+
+
+__all__ = ["Loom", "PandasWeave"]
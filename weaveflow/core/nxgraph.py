@@ -28,17 +28,55 @@ Both graph classes are highly customizable, offering control over size, layout,
 the display of execution timers, and the inclusion of a legend.
 """
 
-from typing import override
+from __future__ import annotations
+
+from itertools import pairwise
+from typing import TYPE_CHECKING, override
 
-import graphviz
 from pandas import DataFrame
 
-from weaveflow._utils import _convert_large_int_to_human_readable
+from weaveflow._utils import (
+    _auto_convert_time_delta,
+    _convert_large_int_to_human_readable,
+)
 
 from ._abstracts import _BaseGraph
 from ._matrix import WeaveMatrix
 from .loom import Loom
 
+if TYPE_CHECKING:
+    import graphviz
+
+# Graphviz layout engines that ignore cluster subgraphs
+_CLUSTERLESS_ENGINES = frozenset({"neato", "sfdp", "twopi", "circo"})
+
+# Attributes of labelled edges, next to the label itself
+_EDGE_LABEL_ATTR = {
+    "fontsize": "10",
+    "fontname": "Helvetica",
+    "labeldistance": "0.5",
+    "decorate": "False",
+}
+
+# Markers of the row change shown on refine graph edges
+_ROWS_ADDED = "🔺"
+_ROWS_REDUCED = "🔻"
+
+# Node shapes and colors per node type, shared by all graphs
+_WEAVE_NODE_STYLES = {
+    "weave": ("box", "#9999ff"),
+    "arg_req": ("box", "#f08080"),
+    "arg_opt": ("box", "#99ff99"),
+    "outputs": ("box", "#fbec5d"),
+    "arg_param": ("box", "#ffb6c1"),
+}
+_REFINE_NODE_STYLES = {
+    "refine": ("box", "#9999ff"),
+    "obj_param": ("box", "#f08080"),
+    "arg_param": ("box", "#ffb6c1"),
+    "boundary": ("box", "#fbec5d"),
+}
+
 # TODO: Make graphviz styles configurable when building the graph
 # https://graphviz.org/doc/info/attrs.html
 
@@ -52,9 +90,11 @@ class WeaveGraph(_BaseGraph):
 
     Attributes:
         loom (Loom): The Loom instance containing the executed weave tasks.
-        weave_collector (defaultdict): A collection of metadata for weave tasks.
+        weave_collector (dict): A collection of metadata for weave tasks.
     """
 
+    __slots__ = ("weave_collector",)
+
     def __init__(self, loom: Loom):
         """Initializes the WeaveGraph with a Loom instance.
 
@@ -73,13 +113,7 @@ class WeaveGraph(_BaseGraph):
     @property
     def _node_styles(self) -> dict:
         """Return the node style dictionary (shapes and colors)."""
-        return {
-            "weave": ("box", "#9999ff"),
-            "arg_req": ("box", "#f08080"),
-            "arg_opt": ("box", "#99ff99"),
-            "outputs": ("box", "#fbec5d"),
-            "arg_param": ("box", "#ffb6c1"),
-        }
+        return _WEAVE_NODE_STYLES
 
     @property
     def _legend_details(self) -> tuple[list[str], list[str]]:
@@ -91,7 +125,7 @@ class WeaveGraph(_BaseGraph):
             "Outputs",
             "SPool Arguments",
         ]
-        colors = [self._node_styles[t][1] for t in self._node_styles]
+        colors = [color for _, color in _WEAVE_NODE_STYLES.values()]
         return names, colors
 
     def _setup(self, weaveflow_name: str):
@@ -105,8 +139,14 @@ class WeaveGraph(_BaseGraph):
             weaveflow_name (str): The name of the weaveflow pipeline to build
                 the graph for.
         """
-
-        for fn, vals in self.weave_collector[weaveflow_name].items():
+        weave_collector = self.weave_collector.get(weaveflow_name)
+        # Nothing to add if no weave task ran
+        if not weave_collector:
+            return
+
+        # Collect nodes and edges of all tasks and add them to the graph at once
+        typed_nodes, edges = [], []
+        for fn, vals in weave_collector.items():
             # Get all relevant nodes
             outputs = vals["outputs"]
             rargs = vals["rargs"]
@@ -114,17 +154,20 @@ class WeaveGraph(_BaseGraph):
             params = vals["params"]
 
             # Assign node types to access them later
-            self._add_graph_nodes(self.graph, fn, type="weave")
-            self._add_graph_nodes(self.graph, outputs, type="outputs")
-            self._add_graph_nodes(self.graph, rargs, type="arg_req")
-            self._add_graph_nodes(self.graph, params, type="arg_param")
-            self._add_graph_nodes(self.graph, oargs, type="arg_opt")
+            typed_nodes.append((fn, "weave"))
+            typed_nodes.extend((v, "outputs") for v in outputs)
+            typed_nodes.extend((v, "arg_req") for v in rargs)
+            typed_nodes.extend((v, "arg_param") for v in params)
+            typed_nodes.extend((v, "arg_opt") for v in oargs)
 
             # Add edges
-            self.graph.add_edges_from([(v, fn) for v in rargs])
-            self.graph.add_edges_from([(v, fn) for v in params])
-            self.graph.add_edges_from([(v, fn) for v in oargs])
-            self.graph.add_edges_from([(fn, v) for v in outputs])
+            edges.extend((v, fn) for v in rargs)
+            edges.extend((v, fn) for v in params)
+            edges.extend((v, fn) for v in oargs)
+            edges.extend((fn, v) for v in outputs)
+
+        self._add_typed_nodes(self.graph, typed_nodes)
+        self.graph.add_edges_from(edges)
 
     def _style_graph_edges(self, g: graphviz.Digraph, weave_collector: dict, timer: bool):
         """Applies styles to edges in the graph.
@@ -138,26 +181,23 @@ class WeaveGraph(_BaseGraph):
             timer (bool): If True, adds execution time labels to edges
                 originating from weave tasks.
         """
+        # Edge attributes only depend on the tail node: optional arguments get
+        # dashed edges, weave tasks their execution time. They are looked up
+        # once per node, so the edges are styled without branching per edge.
+        node_types = dict(self.graph.nodes(data="type"))
+        edge_attrs = {
+            node: {"style": "dashed"} if t == "arg_opt" else {}
+            for node, t in node_types.items()
+        }
+        if timer:
+            for fn, vals in weave_collector.items():
+                delta_time = vals.get("delta_time")
+                if delta_time is not None and node_types[fn] == "weave":
+                    label = _auto_convert_time_delta(delta_time)
+                    edge_attrs[fn] = {"label": label, **_EDGE_LABEL_ATTR}
+
         for n1, n2 in self.graph.edges():
-            edge_attrs = {}
-            node1_type = self.graph.nodes[n1].get("type")
-
-            if node1_type == "arg_opt":
-                edge_attrs["style"] = "dashed"
-
-            if node1_type == "weave" and timer:
-                label = self._extract_date_from_collection(n1, weave_collector)
-                if label:
-                    edge_attrs.update(
-                        {
-                            "label": label,
-                            "fontsize": "10",
-                            "fontname": "Helvetica",
-                            "labeldistance": "0.5",
-                            "decorate": "False",
-                        }
-                    )
-            g.edge(n1, n2, **edge_attrs)
+            g.edge(n1, n2, **edge_attrs[n1])
 
     @override
     def build(
@@ -170,6 +210,7 @@ class WeaveGraph(_BaseGraph):
         legend: bool = True,
         sink_source: bool = False,
         cluster_tasks: bool = False,
+        engine: str = "dot",
     ) -> graphviz.Digraph:
         """Builds and returns the Graphviz Digraph object for the weave tasks.
 
@@ -196,6 +237,11 @@ class WeaveGraph(_BaseGraph):
                 Defaults to False.
             cluster_tasks (bool, optional): If True, groups each weave task and
                 its parameters into a distinct visual cluster. Defaults to True.
+                Engines that ignore clusters (e.g. "neato", "sfdp") skip them.
+            engine (str, optional): The Graphviz layout engine used to render a
+                new graph. "fdp" or "sfdp" handle larger graphs than "dot". The
+                layout only runs on `.render()`; `g.source` returns the DOT text
+                without it. Defaults to "dot".
 
         Returns:
             graphviz.Digraph: A Graphviz Digraph object representing the weave graph.
@@ -222,6 +268,37 @@ class WeaveGraph(_BaseGraph):
         Returns:
             graphviz.Digraph: Plotted graph.
         """
+        args = (additional_graph_attr, size, timer, mindist, legend, sink_source)
+        return self._cached_build(
+            graph,
+            (*args, cluster_tasks, engine),
+            lambda: self._build_graph(
+                graph,
+                additional_graph_attr=additional_graph_attr,
+                size=size,
+                timer=timer,
+                mindist=mindist,
+                legend=legend,
+                sink_source=sink_source,
+                cluster_tasks=cluster_tasks,
+                engine=engine,
+            ),
+        )
+
+    def _build_graph(
+        self,
+        graph: graphviz.Digraph | None,
+        *,
+        additional_graph_attr: dict[str, str] | None,
+        size: int,
+        timer: bool,
+        mindist: float,
+        legend: bool,
+        sink_source: bool,
+        cluster_tasks: bool,
+        engine: str,
+    ) -> graphviz.Digraph:
+        """Builds the weave graph, see `build` for the arguments."""
         g = super().build(
             graph=graph,
             additional_graph_attr=additional_graph_attr,
@@ -229,17 +306,18 @@ class WeaveGraph(_BaseGraph):
             mindist=mindist,
             legend=legend,
             sink_source=sink_source,
+            engine=engine,
         )
 
         # Pass all relevant parameters down to the specific implementation
         self._style_graph_edges(g, self._collector, timer=timer)
 
-        if cluster_tasks:
+        if cluster_tasks and g.engine not in _CLUSTERLESS_ENGINES:
             self._create_task_clusters(g)
 
         return g
 
-    def build_matrix(self) -> DataFrame:
+    def build_matrix(self, sort: bool = True) -> DataFrame:
         """Construct and return a WeaveMatrix for the current weaveflow.
 
         The matrix provides a tabular view of the dependencies between weave
@@ -249,6 +327,11 @@ class WeaveGraph(_BaseGraph):
         the weave_collector (due to upstream population), they are filtered out
         by requiring the presence of the "outputs" key.
 
+        Args:
+            sort (bool, optional): If True, rows and columns are sorted
+                alphabetically; otherwise they follow the execution order of
+                the weave tasks. Defaults to True.
+
         Returns:
             pd.DataFrame: A pandas DataFrame representing the WeaveMatrix.
 
@@ -260,15 +343,19 @@ class WeaveGraph(_BaseGraph):
             print(weave_matrix.head())
             ```
         """
+        return self._cached_build(None, ("matrix", sort), lambda: self._build_matrix(sort))
+
+    def _build_matrix(self, sort: bool) -> DataFrame:
+        """Builds the WeaveMatrix, see `build_matrix` for the arguments."""
         weaveflow_name = self.loom.weaveflow_name
         task_collection = self.weave_collector.get(weaveflow_name, {})
         # Filter to weave-only entries expected by WeaveMatrix
         weave_only = {
             name: vals
             for name, vals in task_collection.items()
-            if isinstance(vals, dict) and "outputs" in vals
+            if type(vals) is dict and "outputs" in vals
         }
-        return WeaveMatrix(weave_only).build()
+        return WeaveMatrix(weave_only).build(sort=sort)
 
 
 class RefineGraph(_BaseGraph):
@@ -280,9 +367,11 @@ class RefineGraph(_BaseGraph):
 
     Attributes:
         loom (Loom): The Loom instance containing the executed refine tasks.
-        refine_collector (defaultdict): A collection of metadata for refine tasks.
+        refine_collector (dict): A collection of metadata for refine tasks.
     """
 
+    __slots__ = ("refine_collector",)
+
     def __init__(self, loom: Loom):
         """Initializes the RefineGraph with a Loom instance.
 
@@ -301,19 +390,14 @@ class RefineGraph(_BaseGraph):
     @property
     def _node_styles(self) -> dict:
         """Return the node style dictionary (shapes and colors)."""
-        return {
-            "refine": ("box", "#9999ff"),
-            "obj_param": ("box", "#f08080"),
-            "arg_param": ("box", "#ffb6c1"),
-            "boundary": ("box", "#fbec5d"),
-        }
+        return _REFINE_NODE_STYLES
 
     @property
     def _legend_details(self) -> tuple[list[str], list[str]]:
         """Return the names and colors for the legend."""
         names = ["Refine Tasks", "SPool Objects", "SPool Arguments", "DataFrame State"]
         colors = [
-            self._node_styles[t][1]
+            _REFINE_NODE_STYLES[t][1]
             for t in ["refine", "obj_param", "arg_param", "boundary"]
         ]
         return names, colors
@@ -329,67 +413,79 @@ class RefineGraph(_BaseGraph):
             weaveflow_name (str): The name of the weaveflow pipeline to build
                 the graph for.
         """
-        refine_collector = self.refine_collector[weaveflow_name]
-        # Add nodes and edges for each refine task
+        refine_collector = self.refine_collector.get(weaveflow_name)
+        # Nothing to add if no refine task ran
+        if not refine_collector:
+            return
+
+        # Collect nodes and edges for each refine task and add them at once
+        typed_nodes, data_edges = [], []
         for fn, vals in refine_collector.items():
             params = vals["params"]
             params_object = vals["params_object"]
             # on_method = vals["on_method"]
             # description = vals["description"]
 
-            self._add_graph_nodes(self.graph, fn, type="refine")
-            self._add_graph_nodes(self.graph, params, type="arg_param")
-            self._add_graph_nodes(self.graph, params_object, type="obj_param")
-            # self._add_graph_nodes(self.graph, on_method, type="on_method")
-            # self._add_graph_nodes(self.graph, description, type="description")
+            typed_nodes.append((fn, "refine"))
+            typed_nodes.extend((v, "arg_param") for v in params or ())
+            typed_nodes.append((params_object, "obj_param"))
 
             # TODO: Integrate description as tooltip
             # TODO: Intergate on_method argument as label
 
             if params and params_object:
                 # Add connection between params (config file args) and params_object
-                self.graph.add_edges_from(
-                    [(v, params_object) for v in params], flow="data"
-                )
+                data_edges.extend((v, params_object) for v in params)
                 # Add connection between params_object and refine task
-                self.graph.add_edge(params_object, fn, flow="data")
-
-        # Add edges between refine tasks and connect to Start/End
-        refine_tasks = list(refine_collector)
-        if refine_tasks:
-            # Add edges between refine tasks
-            if len(refine_tasks) > 1:
-                self.graph.add_edges_from(
-                    [(i, j) for i, j in zip(refine_tasks, refine_tasks[1:], strict=False)],
-                    flow="control",
-                )
-
-            # Add Start/End nodes and connect them to the flow
-            self._add_graph_nodes(self.graph, "Start DataFrame", type="boundary")
-            self._add_graph_nodes(self.graph, "End DataFrame", type="boundary")
-            self.graph.add_edge("Start DataFrame", refine_tasks[0], flow="control")
-            self.graph.add_edge(refine_tasks[-1], "End DataFrame", flow="control")
-
-    @staticmethod
-    def _extract_profiler_from_collection(node: str, collection: dict) -> str | None:
-        """Extracts row reduction info and formats it for the edge label.
+                data_edges.append((params_object, fn))
+
+        # Add Start/End nodes along with the task nodes
+        typed_nodes.extend((v, "boundary") for v in ("Start DataFrame", "End DataFrame"))
+
+        self._add_typed_nodes(self.graph, typed_nodes)
+        self.graph.add_edges_from(data_edges, flow="data")
+
+        # Connect Start/End and the refine tasks in one flow
+        self.graph.add_edges_from(
+            pairwise(["Start DataFrame", *refine_collector, "End DataFrame"]),
+            flow="control",
+        )
+
+    def _edge_labels(
+        self, refine_collector: dict, timer: bool, data_profiler: bool
+    ) -> dict[str, str]:
+        """Builds the edge label of each refine task.
 
         Args:
-            node (str): The name of the task node.
-            collection (dict[str, dict]): The metadata collector (e.g.,
-                `weave_collector` or `refine_collector`).
+            refine_collector (dict): The metadata collector for refine tasks.
+            timer (bool): If True, labels include the execution time.
+            data_profiler (bool): If True, labels include the row reduction.
 
         Returns:
-            str: The formatted row reduction string (e.g., "1,234") or None
-                if not available.
+            dict[str, str]: The label per refine task, for tasks with a label.
         """
-        rows_reduced: int = (
-            collection[node]["rows_reduced"] if node in collection else None
-        )
-        if rows_reduced is None:
-            return None
+        labels = {}
+        if not (timer or data_profiler):
+            return labels
+
+        for fn, vals in refine_collector.items():
+            label_parts = []
 
-        return _convert_large_int_to_human_readable(rows_reduced)
+            # Add execution time label if enabled
+            delta_time = vals.get("delta_time")
+            if timer and delta_time is not None:
+                label_parts.append(_auto_convert_time_delta(delta_time))
+
+            # Add row reduction label if enabled, negative reductions are added rows
+            rows_reduced = vals.get("rows_reduced")
+            if data_profiler and rows_reduced is not None:
+                rows = _convert_large_int_to_human_readable(abs(rows_reduced))
+                marker = _ROWS_ADDED if rows_reduced < 0 else _ROWS_REDUCED
+                label_parts.append(f"{marker} {rows} rows")
+
+            if label_parts:
+                labels[fn] = " | ".join(label_parts)
+        return labels
 
     def _style_graph_edges(
         self,
@@ -409,49 +505,27 @@ class RefineGraph(_BaseGraph):
                 originating from refine tasks.
         """
 
-        # Iterate through all existing edges in the graph
-        for n1, n2 in self.graph.edges():
-            edge_attrs = {}
-            edge_data = self.graph.edges[n1, n2]
-
-            # Set edge width for control flow edges
-            if edge_data.get("flow") == "control":
-                edge_attrs["penwidth"] = "2.0"
-
-            # Build label from multiple parts
-            label_parts = []
-
-            # Add execution time label if enabled
-            if timer:
-                _time_label = self._extract_date_from_collection(n1, refine_collector)
-                if _time_label:
-                    label_parts.append(_time_label)
-
-            # Add row reduction label if enabled
-            if data_profiler:
-                _profiler_label = self._extract_profiler_from_collection(
-                    n1, refine_collector
-                )
-                if _profiler_label:
-                    if _profiler_label.startswith("-"):
-                        _profiler_label = _profiler_label[1:]  # Get rid of the "-"
-                        label_parts.append(f"🔺 {_profiler_label} rows")
-                    else:
-                        label_parts.append(f"🔻 {_profiler_label} rows")
-
-            # Add label to edge if parts exist
-            if label_parts:
-                final_label = " | ".join(label_parts)
-                edge_attrs.update(
-                    {
-                        "label": final_label,
-                        "fontsize": "10",
-                        "fontname": "Helvetica",
-                        "labeldistance": "0.5",
-                        "decorate": "False",
-                    }
-                )
-            # Update the edge with the new attributes
+        # Build the label of each refine task once, not once per outgoing edge
+        labels = self._edge_labels(refine_collector, timer, data_profiler)
+
+        # Edge attributes only depend on the tail node and the flow type, so
+        # they are built once per pair
+        attrs_by_tail = {}
+        # Iterate through all existing edges in the graph with their flow type
+        for n1, n2, flow in self.graph.edges(data="flow"):
+            edge_attrs = attrs_by_tail.get((n1, flow))
+            if edge_attrs is None:
+                edge_attrs = attrs_by_tail[n1, flow] = {}
+
+                # Set edge width for control flow edges
+                if flow == "control":
+                    edge_attrs["penwidth"] = "2.0"
+
+                # Add label to edge if the task has one
+                final_label = labels.get(n1)
+                if final_label:
+                    edge_attrs.update(_EDGE_LABEL_ATTR, label=final_label)
+            # Update the graph with the styled edge
             g.edge(n1, n2, **edge_attrs)
 
     @override
@@ -466,6 +540,7 @@ class RefineGraph(_BaseGraph):
         sink_source: bool = False,
         data_profiler: bool = False,
         cluster_tasks: bool = False,
+        engine: str = "dot",
     ) -> graphviz.Digraph:
         """Builds and returns the Graphviz Digraph object for the refine tasks.
 
@@ -493,6 +568,11 @@ class RefineGraph(_BaseGraph):
                 Defaults to False.
             cluster_tasks (bool, optional): If True, groups each refine task and
                 its parameters into a distinct visual cluster. Defaults to True.
+                Engines that ignore clusters (e.g. "neato", "sfdp") skip them.
+            engine (str, optional): The Graphviz layout engine used to render a
+                new graph. "fdp" or "sfdp" handle larger graphs than "dot". The
+                layout only runs on `.render()`; `g.source` returns the DOT text
+                without it. Defaults to "dot".
 
         Returns:
             graphviz.Digraph: A Graphviz Digraph object representing the refine graph.
@@ -515,6 +595,39 @@ class RefineGraph(_BaseGraph):
             g.render("assets/output/graphs/refine_graph", format="png", cleanup=True)
             ```
         """
+        args = (additional_graph_attr, size, timer, mindist, legend, sink_source)
+        return self._cached_build(
+            graph,
+            (*args, data_profiler, cluster_tasks, engine),
+            lambda: self._build_graph(
+                graph,
+                additional_graph_attr=additional_graph_attr,
+                size=size,
+                timer=timer,
+                mindist=mindist,
+                legend=legend,
+                sink_source=sink_source,
+                data_profiler=data_profiler,
+                cluster_tasks=cluster_tasks,
+                engine=engine,
+            ),
+        )
+
+    def _build_graph(
+        self,
+        graph: graphviz.Digraph | None,
+        *,
+        additional_graph_attr: dict[str, str] | None,
+        size: int,
+        timer: bool,
+        mindist: float,
+        legend: bool,
+        sink_source: bool,
+        data_profiler: bool,
+        cluster_tasks: bool,
+        engine: str,
+    ) -> graphviz.Digraph:
+        """Builds the refine graph, see `build` for the arguments."""
         g = super().build(
             graph=graph,
             additional_graph_attr=additional_graph_attr,
@@ -522,6 +635,7 @@ class RefineGraph(_BaseGraph):
             mindist=mindist,
             legend=legend,
             sink_source=sink_source,
+            engine=engine,
         )
 
         # Pass all relevant parameters down to the specific implementation
@@ -529,7 +643,7 @@ class RefineGraph(_BaseGraph):
             g, self._collector, timer=timer, data_profiler=data_profiler
         )
 
-        if cluster_tasks:
+        if cluster_tasks and g.engine not in _CLUSTERLESS_ENGINES:
             self._create_task_clusters(g)
 
         return g